@@ -0,0 +1,112 @@
+"""Allocation benchmark for the MovementManager control tick.
+
+Runs steady-state control ticks without the worker thread and reports the
+memory traced by `tracemalloc` (net growth over the run, worst transient
+peak within a tick) and the net number of new GC-tracked objects, which is
+the counter that triggers generation-0 collections. A steady-state tick must
+leave both flat: transient NumPy scratch inside ufuncs is freed straight away
+and never reaches the collector.
+
+Usage (from the `bot/` directory):
+    python -m benchmarks.tick_allocations [--ticks N] [--scenario breathing|speech]
+"""
+
+import gc
+import time
+import argparse
+import tracemalloc
+
+import numpy as np
+
+from services.moves import MovementManager
+
+
+# Net traced bytes tolerated over a whole run (interpreter/tracemalloc
+# bookkeeping); it must not scale with the number of ticks
+NET_BYTES_TOLERANCE = 1024
+
+
+class _NullRobot:
+    """Minimal robot endpoint: accepts targets, reports a neutral pose."""
+
+    def set_target(self, head=None, antennas=None, body_yaw=None):
+        pass
+
+    def get_current_joint_positions(self):
+        return [0.0] * 7, [0.0, 0.0]
+
+    def get_current_head_pose(self):
+        return np.eye(4)
+
+
+def _prepare(scenario: str, warmup_ticks: int) -> tuple[MovementManager, float]:
+    manager = MovementManager(_NullRobot())
+    now = time.monotonic()
+    period = manager.target_period
+    # Idle long enough for breathing to start, then finish its interpolation
+    manager.state.last_activity_time = now - 10.0
+    for _ in range(warmup_ticks):
+        now += period
+        manager._tick(now)
+        manager._record_frequency_snapshot(manager._freq_stats)
+
+    if scenario == "speech":
+        hops = 3000
+        times = now + 0.01 * np.arange(hops)
+        offsets = np.zeros((hops, 6))
+        offsets[:, 3] = 0.05 * np.sin(np.arange(hops) / 10.0)
+        manager.queue_speech_offsets(times, offsets)
+        for _ in range(10):
+            now += period
+            manager._tick(now)
+    return manager, now
+
+
+def run(ticks: int, scenario: str) -> dict:
+    """Measure `ticks` steady-state ticks and return per-tick statistics."""
+    manager, now = _prepare(scenario, warmup_ticks=300)
+    period = manager.target_period
+
+    gc.disable()
+    tracemalloc.start()
+    try:
+        worst_transient = 0
+        start_current, _ = tracemalloc.get_traced_memory()
+        gc_before = gc.get_count()[0]
+        for _ in range(ticks):
+            now += period
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            manager._tick(now)
+            manager._record_frequency_snapshot(manager._freq_stats)
+            _, peak = tracemalloc.get_traced_memory()
+            worst_transient = max(worst_transient, peak - before)
+        gc_objects = gc.get_count()[0] - gc_before
+        end_current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+
+    return {
+        "ticks": ticks,
+        "net_bytes": end_current - start_current,
+        "max_transient_bytes_per_tick": worst_transient,
+        "gc_net_objects_per_tick": gc_objects / ticks,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=1000)
+    parser.add_argument("--scenario", choices=("breathing", "speech"), default="breathing")
+    args = parser.parse_args()
+
+    result = run(args.ticks, args.scenario)
+    for key, value in result.items():
+        print(f"{key}: {value}")
+    if result["net_bytes"] > NET_BYTES_TOLERANCE or result["gc_net_objects_per_tick"] > 0:
+        raise SystemExit("steady-state tick allocated memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -34,7 +34,7 @@ import aiohttp
 
 from nat_vision_llm import NATVisionLLMService
 from services.reachy_service import ReachyService
-from services.processor import ReachyWobblerProcessor
+from services.observer import ReachyWobblerObserver
 
 
 load_dotenv(override=True)
@@ -123,14 +123,10 @@ transport_params = {
 async def run_bot(transport: BaseTransport, runner_args: RunnerArguments):
     logger.info("Starting bot")
 
-    # Get Reachy service singleton and ensure fresh state
-    from services.reachy_service import ReachyService
+    # Shared Reachy service (pre-connected by server.py); sessions attach a
+    # lightweight handle instead of rebuilding the robot connection
     reachy_service = ReachyService.get_instance()
-    
-    # Reset wobbler state for new session
-    if reachy_service.wobbler:
-        reachy_service.wobbler.reset()
-        logger.info("Reset Reachy wobbler for new session")
+    reachy_session = None
 
     async with aiohttp.ClientSession() as session:
 
@@ -166,6 +162,8 @@ Be helpful, curious, and express your robot personality!""",
         context_aggregator = LLMContextAggregatorPair(context)
         transcript = TranscriptProcessor()
         rtvi = RTVIProcessor()
+        # Robot head movement; observes TTS audio without delaying it
+        wobbler_observer = ReachyWobblerObserver()
 
         pipeline = Pipeline(
             [
@@ -176,7 +174,6 @@ Be helpful, curious, and express your robot personality!""",
                 context_aggregator.user(),  # User responses
                 llm,  # LLM (via NAT router)
                 tts,  # TTS
-                ReachyWobblerProcessor(),  # Robot head movement
                 transport.output(),  # Transport bot output
                 transcript.assistant(),  # Capture assistant transcripts
                 context_aggregator.assistant(),  # Assistant spoken responses
@@ -189,7 +186,7 @@ Be helpful, curious, and express your robot personality!""",
                 enable_metrics=True,
                 enable_usage_metrics=True,
             ),
-            observers=[RTVIObserver(rtvi)],
+            observers=[RTVIObserver(rtvi), wobbler_observer],
             idle_timeout_secs=runner_args.pipeline_idle_timeout_secs,
         )
 
@@ -209,9 +206,16 @@ Be helpful, curious, and express your robot personality!""",
             
             # Set the user_id for automatic image fetching
             llm.set_user_id(client_id)
+
+            # Fresh wobbler/move state; idle breathing at its normal rate while a client is here.
+            # A reconnect on the same transport replaces the previous session.
+            nonlocal reachy_session
+            if reachy_session:
+                reachy_session.detach()
+            reachy_session = reachy_service.attach_session(f"session {client_id}")
             
             # Don't freeze the robot - let it breathe naturally (antennas will sway)
-            # The wobbler processor will handle movements during speech
+            # The wobbler observer will handle movements during speech
             logger.info("Client ready - robot will breathe naturally until speaking")
 
             # Kick off the conversation.
@@ -227,19 +231,21 @@ Be helpful, curious, and express your robot personality!""",
         async def on_client_disconnected(transport, client):
             logger.info("Client disconnected")
             
-            # Reset wobbler state for next session
-            if reachy_service.wobbler:
-                reachy_service.wobbler.reset()
-                logger.info("Reset Reachy wobbler on disconnect")
-            
-            # Set back to listening pose
-            reachy_service.set_listening_pose()
+            # Reset wobbler/move state, back to breathing; threads and connection stay up
+            if reachy_session:
+                reachy_session.detach()
+            wobbler_observer.reset_state()
             
             await task.cancel()
 
         runner = PipelineRunner(handle_sigint=runner_args.handle_sigint)
 
-        await runner.run(task)
+        try:
+            await runner.run(task)
+        finally:
+            # Pipeline may also end without a disconnect (e.g. idle timeout)
+            if reachy_session:
+                reachy_session.detach()
 
 
 async def bot(runner_args: RunnerArguments):
@@ -57,9 +57,26 @@ SmallWebRTCConnection.__init__ = patched_init
 
 logger.info("✅ Monkey-patch applied! Runner will use configured ICE servers.")
 
+
+def preconnect_reachy():
+    """Connect to the robot and start its control threads at process start.
+
+    Runs in a background thread (readiness polls, then the robot client) so
+    the runner starts serving immediately; sessions then only attach a
+    handle. If the daemon is not up yet, the first session retries.
+    """
+    import threading
+    from services.reachy_service import ReachyService
+
+    threading.Thread(target=ReachyService.get_instance().connect, name="reachy-preconnect", daemon=True).start()
+    logger.info("🤖 Pre-connecting to Reachy in the background...")
+
+
 # Now import and run the normal pipecat runner
 if __name__ == "__main__":
     from pipecat.runner.run import main
+    if os.getenv("REACHY_PRECONNECT", "1") == "1":
+        preconnect_reachy()
     logger.info("🚀 Starting pipecat runner with ICE server injection...")
     main()
 
@@ -5,22 +5,39 @@ and executed sequentially by the MovementManager.
 """
 
 from __future__ import annotations
+import os
+import math
 import logging
-from typing import Tuple
+import threading
+from typing import List, Tuple
+from collections import OrderedDict
 
 import numpy as np
 from numpy.typing import NDArray
 
+from reachy_mini.utils import create_head_pose
 from reachy_mini.motion.move import Move
-from reachy_mini.motion.recorded_move import RecordedMoves
+from reachy_mini.motion.recorded_move import DEFAULT_EMOTIONS_DATASET, RecordedMoves
 from reachy_mini_dances_library.dance_move import DanceMove
 
+from .moves import DenseTrajectoryMove, PresampledMove
+from .move_library import DANCE, EMOTION, CompiledMoveLibrary, load_move_library
+
 
 logger = logging.getLogger(__name__)
 
+# Number of dance/emotion evaluators kept by the move registry
+MOVE_CACHE_SIZE = int(os.getenv("REACHY_MOVE_CACHE_SIZE", "32"))
+# Moves preloaded on connect, as comma-separated "dance:<name>" / "emotion:<name>"
+WARMUP_MOVES = os.getenv("REACHY_WARMUP_MOVES", "")
+
 
 class DanceQueueMove(Move):  # type: ignore
-    """Wrapper for dance moves to work with the movement queue system."""
+    """Wrapper for dance moves to work with the movement queue system.
+
+    Builds the dance on every construction; play dances through
+    `get_move_registry().dance(name)`, which builds and samples it once.
+    """
 
     def __init__(self, move_name: str):
         """Initialize a DanceQueueMove."""
@@ -47,14 +64,16 @@ class DanceQueueMove(Move):  # type: ignore
         except Exception as e:
             logger.error(f"Error evaluating dance move '{self.move_name}' at t={t}: {e}")
             # Return neutral pose on error
-            from reachy_mini.utils import create_head_pose
-
             neutral_head_pose = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
             return (neutral_head_pose, np.array([0.0, 0.0], dtype=np.float64), 0.0)
 
 
 class EmotionQueueMove(Move):  # type: ignore
-    """Wrapper for emotion moves to work with the movement queue system."""
+    """Wrapper for emotion moves to work with the movement queue system.
+
+    Play emotions through `get_move_registry().emotion(name)`, which builds
+    and samples each one once.
+    """
 
     def __init__(self, emotion_name: str, recorded_moves: RecordedMoves):
         """Initialize an EmotionQueueMove."""
@@ -81,14 +100,61 @@ class EmotionQueueMove(Move):  # type: ignore
         except Exception as e:
             logger.error(f"Error evaluating emotion '{self.emotion_name}' at t={t}: {e}")
             # Return neutral pose on error
-            from reachy_mini.utils import create_head_pose
-
             neutral_head_pose = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
             return (neutral_head_pose, np.array([0.0, 0.0], dtype=np.float64), 0.0)
 
 
+def _rotation_axis_angle(rotation: NDArray[np.float64]) -> Tuple[NDArray[np.float64], float]:
+    """Return (unit axis, angle in [0, pi]) of a 3x3 rotation matrix.
+
+    Goes through the quaternion (Shepperd's method, stable for any angle) and
+    picks the shortest rotation, like `linear_pose_interpolation`.
+    """
+    m = rotation
+    trace = m[0, 0] + m[1, 1] + m[2, 2]
+    k = int(np.argmax((trace, m[0, 0], m[1, 1], m[2, 2])))
+    if k == 0:
+        w = math.sqrt(max(0.0, 1.0 + trace)) / 2
+        x, y, z = (m[2, 1] - m[1, 2]) / (4 * w), (m[0, 2] - m[2, 0]) / (4 * w), (m[1, 0] - m[0, 1]) / (4 * w)
+    elif k == 1:
+        x = math.sqrt(max(0.0, 1.0 + m[0, 0] - m[1, 1] - m[2, 2])) / 2
+        w, y, z = (m[2, 1] - m[1, 2]) / (4 * x), (m[0, 1] + m[1, 0]) / (4 * x), (m[0, 2] + m[2, 0]) / (4 * x)
+    elif k == 2:
+        y = math.sqrt(max(0.0, 1.0 - m[0, 0] + m[1, 1] - m[2, 2])) / 2
+        w, x, z = (m[0, 2] - m[2, 0]) / (4 * y), (m[0, 1] + m[1, 0]) / (4 * y), (m[1, 2] + m[2, 1]) / (4 * y)
+    else:
+        z = math.sqrt(max(0.0, 1.0 - m[0, 0] - m[1, 1] + m[2, 2])) / 2
+        w, x, y = (m[1, 0] - m[0, 1]) / (4 * z), (m[0, 2] + m[2, 0]) / (4 * z), (m[1, 2] + m[2, 1]) / (4 * z)
+    if w < 0:
+        w, x, y, z = -w, -x, -y, -z
+    sin_half = math.sqrt(x * x + y * y + z * z)
+    if sin_half < 1e-12:
+        return np.array([1.0, 0.0, 0.0]), 0.0
+    return np.array([x, y, z]) / sin_half, 2 * math.atan2(sin_half, w)
+
+
+def _orthonormalize(rotation: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Nearest proper rotation matrix (SVD)."""
+    u, _, vt = np.linalg.svd(rotation)
+    if np.linalg.det(u @ vt) < 0:
+        u[:, -1] = -u[:, -1]
+    return u @ vt
+
+
 class GotoQueueMove(Move):  # type: ignore
-    """Wrapper for goto moves to work with the movement queue system."""
+    """Wrapper for goto moves to work with the movement queue system.
+
+    The interpolation is decomposed once at construction: with the relative
+    rotation as axis `a` and angle `theta`, Rodrigues' formula gives
+    R(s) = R0 + sin(s*theta) R0 K + (1 - cos(s*theta)) R0 K^2 (K = [a]x), so
+    the top 3x4 rows of the pose are one (4,) x (4, 12) product of
+    [1, sin, 1 - cos, s] with precomputed bases. Same path as
+    `linear_pose_interpolation` (geodesic rotation, linear translation).
+    This is cheaper than interpolating a pre-sampled trajectory, so the
+    movement manager evaluates it live (`presample = False`).
+    """
+
+    presample = False
 
     def __init__(
         self,
@@ -109,42 +175,63 @@ class GotoQueueMove(Move):  # type: ignore
         self.target_body_yaw = target_body_yaw
         self.start_body_yaw = start_body_yaw or 0
 
+        # Precomputed decomposition (see class docstring)
+        start = np.asarray(
+            start_head_pose if start_head_pose is not None else create_head_pose(0, 0, 0, 0, 0, 0, degrees=True),
+            dtype=np.float64,
+        )
+        target = np.asarray(target_head_pose, dtype=np.float64)
+        rot_start = _orthonormalize(start[:3, :3])
+        axis, self._angle = _rotation_axis_angle(rot_start.T @ _orthonormalize(target[:3, :3]))
+        skew = np.array([[0.0, -axis[2], axis[1]], [axis[2], 0.0, -axis[0]], [-axis[1], axis[0], 0.0]])
+        basis = np.zeros((4, 3, 4), dtype=np.float64)
+        basis[0, :, :3] = rot_start
+        basis[0, :, 3] = start[:3, 3]
+        basis[1, :, :3] = rot_start @ skew
+        basis[2, :, :3] = rot_start @ skew @ skew
+        basis[3, :, 3] = target[:3, 3] - start[:3, 3]
+        self._basis = basis.reshape(4, 12)
+        self._coefficients = np.array([1.0, 0.0, 0.0, 0.0])
+        self._antenna_start = (float(self.start_antennas[0]), float(self.start_antennas[1]))
+        self._antenna_delta = (
+            float(self.target_antennas[0]) - self._antenna_start[0],
+            float(self.target_antennas[1]) - self._antenna_start[1],
+        )
+        self._body_yaw_delta = self.target_body_yaw - self.start_body_yaw
+        self._head = np.eye(4, dtype=np.float64)
+        self._top_rows = self._head[:3].reshape(12)  # view: the product lands in the pose
+        self._antennas = np.zeros(2, dtype=np.float64)
+
     @property
     def duration(self) -> float:
         """Duration property required by official Move interface."""
         return self._duration
 
     def evaluate(self, t: float) -> tuple[NDArray[np.float64] | None, NDArray[np.float64] | None, float | None]:
-        """Evaluate goto move at time t using linear interpolation."""
-        try:
-            from reachy_mini.utils import create_head_pose
-            from reachy_mini.utils.interpolation import linear_pose_interpolation
+        """Evaluate goto move at time t using linear interpolation.
 
+        The returned arrays are reused across calls.
+        """
+        try:
             # Clamp t to [0, 1] for interpolation
             t_clamped = max(0, min(1, t / self.duration))
 
-            # Use start pose if available, otherwise neutral
-            if self.start_head_pose is not None:
-                start_pose = self.start_head_pose
-            else:
-                start_pose = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
-
             # Interpolate head pose
-            head_pose = linear_pose_interpolation(start_pose, self.target_head_pose, t_clamped)
+            phi = self._angle * t_clamped
+            coefficients = self._coefficients
+            coefficients[1] = math.sin(phi)
+            coefficients[2] = 1.0 - math.cos(phi)
+            coefficients[3] = t_clamped
+            np.dot(coefficients, self._basis, out=self._top_rows)
 
             # Interpolate antennas - return as numpy array
-            antennas = np.array(
-                [
-                    self.start_antennas[0] + (self.target_antennas[0] - self.start_antennas[0]) * t_clamped,
-                    self.start_antennas[1] + (self.target_antennas[1] - self.start_antennas[1]) * t_clamped,
-                ],
-                dtype=np.float64,
-            )
+            self._antennas[0] = self._antenna_start[0] + self._antenna_delta[0] * t_clamped
+            self._antennas[1] = self._antenna_start[1] + self._antenna_delta[1] * t_clamped
 
             # Interpolate body yaw
-            body_yaw = self.start_body_yaw + (self.target_body_yaw - self.start_body_yaw) * t_clamped
+            body_yaw = self.start_body_yaw + self._body_yaw_delta * t_clamped
 
-            return (head_pose, antennas, body_yaw)
+            return (self._head, self._antennas, body_yaw)
 
         except Exception as e:
             logger.error(f"Error evaluating goto move at t={t}: {e}")
@@ -152,3 +239,117 @@ class GotoQueueMove(Move):  # type: ignore
             target_head_pose_f64 = self.target_head_pose.astype(np.float64)
             target_antennas_array = np.array([self.target_antennas[0], self.target_antennas[1]], dtype=np.float64)
             return (target_head_pose_f64, target_antennas_array, self.target_body_yaw)
+
+
+class MoveRegistry:
+    """Process-wide LRU cache of dance and emotion trajectories.
+
+    Moves come from the compiled move library when it has them; otherwise
+    the live wrapper is built once and cached as a `PresampledMove`, so its
+    dense trajectory is also sampled only once. The cache holds templates:
+    every lookup returns a new move over the shared samples, with its own
+    output buffers, so callers can play the same move concurrently.
+    """
+
+    def __init__(self, maxsize: int = MOVE_CACHE_SIZE, library: CompiledMoveLibrary | None = None):
+        """Initialize the registry (`library` defaults to `load_move_library()`)."""
+        self.maxsize = max(1, maxsize)
+        self._library = library if library is not None else load_move_library()
+        self._recorded_moves: RecordedMoves | None = None
+        self._cache: OrderedDict[Tuple[str, str], Move] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def dance(self, move_name: str) -> DenseTrajectoryMove:
+        """Return a new move for a dance."""
+        return self.get(DANCE, move_name)
+
+    def emotion(self, emotion_name: str) -> DenseTrajectoryMove:
+        """Return a new move for an emotion."""
+        return self.get(EMOTION, emotion_name)
+
+    def get(self, kind: str, name: str) -> DenseTrajectoryMove:
+        """Return a new move of `kind` (DANCE or EMOTION) called `name`.
+
+        Raises KeyError for an unknown kind and whatever the underlying
+        library raises for an unknown name.
+        """
+        return self._template(kind, name).instance()
+
+    def _template(self, kind: str, name: str) -> DenseTrajectoryMove:
+        key = (kind, name)
+        with self._lock:
+            move = self._cache.get(key)
+            if move is not None:
+                self._cache.move_to_end(key)
+                return move
+
+        # Built outside the lock: loading a library can take a while
+        move = self._build(kind, name)
+        with self._lock:
+            move = self._cache.setdefault(key, move)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return move
+
+    def _build(self, kind: str, name: str) -> DenseTrajectoryMove:
+        if self._library is not None and (kind, name) in self._library:
+            return self._library.get(kind, name)
+        if kind == DANCE:
+            return PresampledMove(DanceQueueMove(name))
+        if kind == EMOTION:
+            return PresampledMove(EmotionQueueMove(name, self._get_recorded_moves()))
+        raise KeyError(f"Unknown move kind: {kind}")
+
+    def _get_recorded_moves(self) -> RecordedMoves:
+        # Racing first calls may both load; the first one stored wins
+        if self._recorded_moves is None:
+            recorded_moves = RecordedMoves(DEFAULT_EMOTIONS_DATASET)
+            with self._lock:
+                if self._recorded_moves is None:
+                    self._recorded_moves = recorded_moves
+        return self._recorded_moves
+
+    def warm_up(self, specs: List[str]) -> int:
+        """Preload moves given as "dance:<name>" / "emotion:<name>"; returns how many loaded.
+
+        Live moves are also sampled, so their first playback is served from
+        the dense trajectory. Failures are logged and skipped.
+        """
+        loaded = 0
+        for spec in specs:
+            kind, _, name = spec.strip().partition(":")
+            if not name:
+                logger.warning("Ignoring move warm-up entry '%s' (expected kind:name)", spec)
+                continue
+            try:
+                move = self._template(kind, name)
+                if isinstance(move, PresampledMove) and not move.is_sampled:
+                    move.sample()
+                loaded += 1
+            except Exception as e:
+                logger.warning("Failed to warm up %s '%s': %s", kind, name, e)
+        return loaded
+
+
+_registry: MoveRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_move_registry() -> MoveRegistry:
+    """Return the process-wide move registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = MoveRegistry()
+        return _registry
+
+
+def warm_up_moves(specs: str = WARMUP_MOVES) -> int:
+    """Preload the comma-separated `specs` into the process-wide registry."""
+    entries = [spec for spec in specs.split(",") if spec.strip()]
+    if not entries:
+        return 0
+    loaded = get_move_registry().warm_up(entries)
+    logger.info("Warmed up %d/%d moves", loaded, len(entries))
+    return loaded
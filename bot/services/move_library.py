@@ -0,0 +1,219 @@
+"""Compiled, memory-mapped library of dance and emotion trajectories.
+
+Dances (`reachy_mini_dances_library`) and emotions (recorded moves dataset)
+are sampled offline at a fixed rate into one binary file, normally at image
+build time:
+
+    python -m services.move_library --output /app/move_library.bin
+
+At runtime `load_move_library()` memory-maps that file once per process and
+serves `DenseTrajectoryMove` objects whose arrays are zero-copy views of the
+mapping, so sessions share the pages and no library is loaded before the
+first emote. Playback reads it through the move registry
+(`ReachyService.play_dance` / `play_emotion`).
+
+File layout (little endian):
+- 8 bytes magic, 8 bytes uint64 header length, UTF-8 JSON header
+- float32 sections, each aligned to 64 bytes: heads (N, 4, 4),
+  antennas (N, 2), body_yaw (N,), N being the total sample count
+The header lists every move with its kind, name, duration, first sample
+and sample count.
+"""
+
+from __future__ import annotations
+import os
+import sys
+import json
+import struct
+import logging
+import argparse
+import threading
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from reachy_mini.motion.move import Move
+
+from .moves import CONTROL_LOOP_FREQUENCY_HZ, DenseTrajectoryMove, sample_dense_trajectory
+
+
+logger = logging.getLogger(__name__)
+
+MOVE_LIBRARY_PATH = os.getenv("REACHY_MOVE_LIBRARY", "/app/move_library.bin")
+MOVE_LIBRARY_MAGIC = b"RMTRAJ1\0"
+MOVE_LIBRARY_VERSION = 1
+DANCE = "dance"
+EMOTION = "emotion"
+# `main()` exit status when the move sources (datasets) cannot be loaded,
+# as opposed to a failed compile (sysexits EX_UNAVAILABLE)
+EXIT_SOURCES_UNAVAILABLE = 69
+_SECTION_ALIGN = 64
+_DTYPE = np.dtype("<f4")
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _SECTION_ALIGN) * _SECTION_ALIGN
+
+
+class CompiledMoveLibrary:
+    """Read-only view of a compiled trajectory file."""
+
+    def __init__(self, path: str):
+        """Memory-map `path`; raises ValueError if it is not a move library."""
+        self.path = path
+        with open(path, "rb") as f:
+            magic, header_len = struct.unpack("<8sQ", f.read(16))
+            if magic != MOVE_LIBRARY_MAGIC:
+                raise ValueError(f"{path} is not a compiled move library")
+            header = json.loads(f.read(header_len))
+        if header.get("version") != MOVE_LIBRARY_VERSION:
+            raise ValueError(f"Unsupported move library version in {path}: {header.get('version')}")
+
+        self.rate_hz: float = header["rate_hz"]
+        total = header["total_samples"]
+        sections = header["sections"]
+        self._heads = np.memmap(path, dtype=_DTYPE, mode="r", offset=sections["heads"], shape=(total, 4, 4))
+        self._antennas = np.memmap(path, dtype=_DTYPE, mode="r", offset=sections["antennas"], shape=(total, 2))
+        self._body_yaw = np.memmap(path, dtype=_DTYPE, mode="r", offset=sections["body_yaw"], shape=(total,))
+        self._index: Dict[Tuple[str, str], Tuple[float, int, int]] = {
+            (entry["kind"], entry["name"]): (entry["duration"], entry["start"], entry["count"])
+            for entry in header["moves"]
+        }
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._index
+
+    def names(self, kind: str) -> List[str]:
+        """Names of the compiled moves of one kind (DANCE or EMOTION)."""
+        return [name for move_kind, name in self._index if move_kind == kind]
+
+    def get(self, kind: str, name: str) -> DenseTrajectoryMove:
+        """Return a new move over the shared samples; raises KeyError if absent."""
+        duration, start, count = self._index[(kind, name)]
+        stop = start + count
+        return DenseTrajectoryMove(
+            duration,
+            self._heads[start:stop],
+            self._antennas[start:stop],
+            self._body_yaw[start:stop],
+        )
+
+
+_library: CompiledMoveLibrary | None = None
+_library_loaded = False
+_library_lock = threading.Lock()
+
+
+def load_move_library(path: str | None = None) -> CompiledMoveLibrary | None:
+    """Return the process-wide compiled library, or None if there is none.
+
+    The file is mapped on first use; a missing or invalid file is logged once
+    and callers fall back to the live dance and emotion libraries.
+    """
+    global _library, _library_loaded
+    with _library_lock:
+        if not _library_loaded:
+            _library_loaded = True
+            path = path or MOVE_LIBRARY_PATH
+            if not os.path.exists(path):
+                logger.info("No compiled move library at %s; dances and emotions are evaluated live", path)
+            else:
+                try:
+                    _library = CompiledMoveLibrary(path)
+                    logger.info("Mapped compiled move library %s (%d moves)", path, len(_library._index))
+                except (OSError, ValueError, KeyError) as e:
+                    logger.warning("Ignoring compiled move library %s: %s", path, e)
+        return _library
+
+
+def _library_sources() -> List[Tuple[str, str, Move]]:
+    """Every dance and emotion, as (kind, name, live move)."""
+    from reachy_mini.motion.recorded_move import DEFAULT_EMOTIONS_DATASET, RecordedMoves
+    from reachy_mini_dances_library.dance_move import DanceMove
+    from reachy_mini_dances_library.collection.dance import AVAILABLE_MOVES
+
+    sources: List[Tuple[str, str, Move]] = [(DANCE, name, DanceMove(name)) for name in sorted(AVAILABLE_MOVES)]
+    emotions = RecordedMoves(DEFAULT_EMOTIONS_DATASET)
+    sources.extend((EMOTION, name, emotions.get(name)) for name in sorted(emotions.list_moves()))
+    return sources
+
+
+def compile_move_library(
+    output: str,
+    rate_hz: float = CONTROL_LOOP_FREQUENCY_HZ,
+    sources: List[Tuple[str, str, Move]] | None = None,
+) -> Dict[str, Any]:
+    """Sample every move at `rate_hz` and write the library to `output`.
+
+    Returns the header that was written. The file is written next to
+    `output` and renamed into place, so readers never see a partial file.
+    """
+    entries = []
+    heads_parts, antennas_parts, yaw_parts = [], [], []
+    total = 0
+    for kind, name, move in sources if sources is not None else _library_sources():
+        duration = float(move.duration)
+        if not 0.0 < duration < float("inf"):
+            logger.warning("Skipping %s '%s' with duration %s", kind, name, duration)
+            continue
+        heads, antennas, body_yaw = sample_dense_trajectory(move, rate_hz)
+        entries.append({"kind": kind, "name": name, "duration": duration, "start": total, "count": len(heads)})
+        heads_parts.append(heads)
+        antennas_parts.append(antennas)
+        yaw_parts.append(body_yaw)
+        total += len(heads)
+
+    sections_data: List[Tuple[str, NDArray[Any]]] = [
+        ("heads", np.concatenate(heads_parts) if heads_parts else np.empty((0, 4, 4))),
+        ("antennas", np.concatenate(antennas_parts) if antennas_parts else np.empty((0, 2))),
+        ("body_yaw", np.concatenate(yaw_parts) if yaw_parts else np.empty(0)),
+    ]
+    header: Dict[str, Any] = {
+        "version": MOVE_LIBRARY_VERSION,
+        "rate_hz": rate_hz,
+        "total_samples": total,
+        "moves": entries,
+        "sections": {},
+    }
+    # Offsets depend on the header length, which depends on the offsets:
+    # reserve room for them first, then pad the header to the reserved size
+    header["sections"] = {key: 0 for key, _ in sections_data}
+    header_len = len(json.dumps(header).encode()) + 32 * len(sections_data)
+    offset = _align(16 + header_len)
+    for key, data in sections_data:
+        header["sections"][key] = offset
+        offset = _align(offset + data.size * _DTYPE.itemsize)
+    header_bytes = json.dumps(header).encode().ljust(header_len)
+
+    tmp_path = f"{output}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(struct.pack("<8sQ", MOVE_LIBRARY_MAGIC, header_len))
+        f.write(header_bytes)
+        for key, data in sections_data:
+            f.seek(header["sections"][key])
+            f.write(np.ascontiguousarray(data, dtype=_DTYPE).tobytes())
+        f.truncate(offset)
+    os.replace(tmp_path, output)
+    return header
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compile dances and emotions into a memory-mapped trajectory file.")
+    parser.add_argument("--output", default=MOVE_LIBRARY_PATH)
+    parser.add_argument("--rate", type=float, default=CONTROL_LOOP_FREQUENCY_HZ, help="samples per second")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        sources = _library_sources()
+    except OSError as e:  # hub/network outage: no library, moves are evaluated live
+        print(f"WARNING: move datasets unavailable, no library written: {e}", file=sys.stderr)
+        raise SystemExit(EXIT_SOURCES_UNAVAILABLE)
+    header = compile_move_library(args.output, args.rate, sources)
+    size_kib = os.path.getsize(args.output) / 1024
+    print(f"{args.output}: {len(header['moves'])} moves, {header['total_samples']} samples, {size_kib:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
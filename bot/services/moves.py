@@ -3,10 +3,19 @@
 Design overview
 - Primary moves (emotions, dances, goto, breathing) are mutually exclusive and run
   sequentially.
+- Finite primary moves are pre-sampled at the control rate on a background
+  thread while queued (`PresampledMove`); the tick interpolates the dense
+  array and only falls back to live `evaluate` until sampling completes.
+  Moves that are already dense (`DenseTrajectoryMove`, e.g. from the compiled
+  move library) or cheap to evaluate (`presample = False`) are queued as they are.
 - Secondary moves (speech sway, face tracking) are additive offsets applied on top
   of the current primary pose.
 - There is a single control point to the robot: `ReachyMini.set_target`.
-- The control loop runs near 100 Hz and is phase-aligned via a monotonic clock.
+- The control loop runs at 100 Hz while anything moves, 25 Hz while only
+  breathing and 2 Hz when idle without a client session; new commands or speech
+  wake it immediately. It is phase-aligned via a monotonic clock:
+  ticks start on absolute deadlines `t0 + k * period`, optionally spinning through
+  the last fraction of a millisecond, and overruns follow an explicit policy.
 - Idle behaviour starts an infinite `BreathingMove` after a short inactivity delay
   unless listening is active.
 
@@ -16,7 +25,8 @@ Threading model
 - Other threads communicate via a command queue (enqueue moves, mark activity,
   toggle listening).
 - Secondary offset producers set pending values guarded by locks; the worker
-  snaps them atomically.
+  snaps them atomically. Speech sway is published ahead of time as a
+  timestamped `SpeechOffsetTrajectory` that the worker samples at tick time.
 
 Units and frames
 - Secondary offsets are interpreted as metres for x/y/z and radians for
@@ -29,13 +39,19 @@ Safety
 - Listening freezes antennas, then blends them back on unfreeze.
 - Interpolations and blends are used to avoid jumps at all times.
 - `set_target` errors are rate-limited in logs.
+- Optional deadband: while the fused pose stays within small tolerances of the
+  last sent one, `set_target` is skipped except for a periodic keep-alive.
 """
 
 from __future__ import annotations
+import math
 import time
+import bisect
+from array import array
 import logging
 import threading
 from queue import Empty, Queue
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Tuple
 from collections import deque
 from dataclasses import dataclass
@@ -56,9 +72,33 @@ logger = logging.getLogger(__name__)
 
 # Configuration constants
 CONTROL_LOOP_FREQUENCY_HZ = 100.0  # Hz - Target frequency for the movement control loop
+BREATHING_LOOP_FREQUENCY_HZ = 25.0  # Hz - while only breathing (or holding a static pose)
+NO_SESSION_LOOP_FREQUENCY_HZ = 2.0  # Hz - trickle when idle with no client session
+RATE_FULL = "full"  # primary move, speech sway, face tracking or antenna blend running
+RATE_BREATHING = "breathing"
+RATE_NO_SESSION = "no_session"
+PRESAMPLE_MAX_DURATION_S = 120.0  # s - longer finite moves are evaluated live
+SPEECH_TRAJECTORY_CAPACITY = 3000  # rows - 30 s of 10 ms speech sway hops
+SPEECH_TRAJECTORY_MAX_GAP_S = 0.1  # s - rows further apart are held, not interpolated
+OVERRUN_SKIP = "skip"  # late tick: drop the missed slots, stay on the original phase
+OVERRUN_CATCH_UP = "catch_up"  # late tick: run missed slots back to back (bounded)
+DEADBAND_HEAD_TOLERANCE = 1e-4  # max abs change of any head pose matrix entry (m / rotation)
+DEADBAND_ANTENNA_TOLERANCE = 1e-3  # rad
+DEADBAND_BODY_YAW_TOLERANCE = 1e-3  # rad
+DEADBAND_KEEPALIVE_S = 0.5  # s - a suppressed pose is still re-sent this often
+FREQUENCY_LOG_INTERVAL_S = 2.0  # s - between loop frequency debug logs
+LATENCY_WINDOW_S = 2.0  # s - window of the per-stage latency histograms
+LATENCY_BUCKET_MIN_S = 1e-6  # s - upper edge of the first latency bucket
+LATENCY_BUCKET_MAX_S = 0.1  # s - upper edge of the last bucket (anything slower overflows)
+LATENCY_BUCKET_COUNT = 52  # geometric buckets, ~25% wide
+
+# Control-loop stages timed per tick, in `working_loop` order
+TICK_STAGES = ("poll_signals", "primary_motion", "face_tracking", "compose", "antenna_blend", "set_target", "tick")
+STAGE_POLL, STAGE_PRIMARY, STAGE_FACE, STAGE_COMPOSE, STAGE_BLEND, STAGE_SET_TARGET, STAGE_TICK = range(len(TICK_STAGES))
 
 # Type definitions
 FullBodyPose = Tuple[NDArray[np.float32], Tuple[float, float], float]  # (head_pose_4x4, antennas, body_yaw)
+ZERO_OFFSETS: Tuple[float, float, float, float, float, float] = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
 
 
 class BreathingMove(Move):  # type: ignore
@@ -69,6 +109,7 @@ class BreathingMove(Move):  # type: ignore
         interpolation_start_pose: NDArray[np.float32],
         interpolation_start_antennas: Tuple[float, float],
         interpolation_duration: float = 1.0,
+        breathe: bool = True,
     ):
         """Initialize breathing move.
 
@@ -76,22 +117,29 @@ class BreathingMove(Move):  # type: ignore
             interpolation_start_pose: 4x4 matrix of current head pose to interpolate from
             interpolation_start_antennas: Current antenna positions to interpolate from
             interpolation_duration: Duration of interpolation to neutral (seconds)
+            breathe: False holds the neutral pose after the interpolation (static,
+                safe for the no-session rate tier)
 
         """
         self.interpolation_start_pose = interpolation_start_pose
         self.interpolation_start_antennas = np.array(interpolation_start_antennas)
         self.interpolation_duration = interpolation_duration
+        self.breathe = breathe
 
         # Neutral positions for breathing base
         self.neutral_head_pose = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
         self.neutral_antennas = np.array([0.0, 0.0])
 
-        # Breathing parameters
-        self.breathing_z_amplitude = 0.005  # 5mm gentle breathing
+        # Breathing parameters (zero amplitudes hold neutral)
+        self.breathing_z_amplitude = 0.005 if breathe else 0.0  # 5mm gentle breathing
         self.breathing_frequency = 0.1  # Hz (6 breaths per minute)
-        self.antenna_sway_amplitude = np.deg2rad(15)  # 15 degrees
+        self.antenna_sway_amplitude = np.deg2rad(15) if breathe else 0.0  # 15 degrees
         self.antenna_frequency = 0.5  # Hz (faster antenna sway)
 
+        # Reused outputs for the breathing phase; callers copy what they keep
+        self._breathing_head = self.neutral_head_pose.copy()
+        self._breathing_antennas = np.zeros(2, dtype=np.float64)
+
     @property
     def duration(self) -> float:
         """Duration property required by official Move interface."""
@@ -118,18 +166,254 @@ class BreathingMove(Move):  # type: ignore
             # Phase 2: Breathing patterns from neutral base
             breathing_time = t - self.interpolation_duration
 
-            # Gentle z-axis breathing
-            z_offset = self.breathing_z_amplitude * np.sin(2 * np.pi * self.breathing_frequency * breathing_time)
-            head_pose = create_head_pose(x=0, y=0, z=z_offset, roll=0, pitch=0, yaw=0, degrees=True, mm=False)
+            # Gentle z-axis breathing (neutral pose translated along z)
+            z_offset = self.breathing_z_amplitude * math.sin(2 * math.pi * self.breathing_frequency * breathing_time)
+            head_pose = self._breathing_head
+            head_pose[2, 3] = z_offset
 
             # Antenna sway (opposite directions)
-            antenna_sway = self.antenna_sway_amplitude * np.sin(2 * np.pi * self.antenna_frequency * breathing_time)
-            antennas = np.array([antenna_sway, -antenna_sway], dtype=np.float64)
+            antenna_sway = self.antenna_sway_amplitude * math.sin(2 * math.pi * self.antenna_frequency * breathing_time)
+            antennas = self._breathing_antennas
+            antennas[0] = antenna_sway
+            antennas[1] = -antenna_sway
 
         # Return in official Move interface format: (head_pose, antennas_array, body_yaw)
         return (head_pose, antennas, 0.0)
 
 
+def sample_dense_trajectory(
+    move: Move, rate_hz: float, yield_gil: bool = False,
+) -> Tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]:
+    """Evaluate a finite move on a uniform grid of at least `rate_hz`.
+
+    Returns (heads (n, 4, 4), antennas (n, 2), body_yaw (n,)), the first and
+    last rows at t=0 and t=duration; missing values are filled like the
+    control loop does (neutral head, zero antennas and yaw). With `yield_gil`
+    the GIL is released after every evaluation, so a concurrent control
+    thread is never held off for longer than one `evaluate` call.
+    """
+    duration = float(move.duration)
+    intervals = max(1, math.ceil(duration * rate_hz))
+    times = np.linspace(0.0, duration, intervals + 1)
+    heads = np.empty((intervals + 1, 4, 4), dtype=np.float64)
+    antennas = np.zeros((intervals + 1, 2), dtype=np.float64)
+    body_yaw = np.zeros(intervals + 1, dtype=np.float64)
+    neutral = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
+    for k, t in enumerate(times):
+        head, ant, yaw = move.evaluate(float(t))
+        heads[k] = neutral if head is None else head
+        if ant is not None:
+            antennas[k, 0] = ant[0]
+            antennas[k, 1] = ant[1]
+        if yaw is not None:
+            body_yaw[k] = yaw
+        if yield_gil:
+            time.sleep(0)
+    return heads, antennas, body_yaw
+
+
+class DenseTrajectoryMove(Move):  # type: ignore
+    """Finite move interpolated from uniformly sampled arrays.
+
+    The arrays are only read, so they may be shared between instances or be
+    views of a memory-mapped file. Head poses are interpolated element-wise,
+    which over one sample period (<= 10 ms) stays orthonormal to well below
+    the robot's resolution. The returned arrays are reused across calls, so
+    an instance has a single user; `instance()` gives each user its own.
+    """
+
+    def __init__(
+        self,
+        duration: float,
+        heads: NDArray[np.floating] | None = None,
+        antennas: NDArray[np.floating] | None = None,
+        body_yaw: NDArray[np.floating] | None = None,
+    ):
+        """Initialize from (n >= 2) samples spanning [0, duration], or publish them later."""
+        self._duration = float(duration)
+        # (heads (n, 4, 4), antennas (n, 2), body_yaw (n,), samples per second)
+        self._frames: Tuple[NDArray[np.floating], NDArray[np.floating], NDArray[np.floating], float] | None = None
+        self._head = np.eye(4, dtype=np.float64)
+        self._antennas = np.zeros(2, dtype=np.float64)
+        if heads is not None and antennas is not None and body_yaw is not None:
+            self._publish_frames(heads, antennas, body_yaw)
+
+    def _publish_frames(
+        self, heads: NDArray[np.floating], antennas: NDArray[np.floating], body_yaw: NDArray[np.floating],
+    ) -> None:
+        # Single assignment: a concurrent evaluate sees all of it or nothing
+        self._frames = (heads, antennas, body_yaw, (heads.shape[0] - 1) / self._duration)
+
+    @property
+    def duration(self) -> float:
+        """Duration property required by official Move interface."""
+        return self._duration
+
+    def instance(self) -> DenseTrajectoryMove:
+        """Return a new move over the same samples, with its own output buffers."""
+        heads, antennas, body_yaw, _ = self._frames
+        return DenseTrajectoryMove(self._duration, heads, antennas, body_yaw)
+
+    def evaluate(self, t: float) -> tuple[NDArray[np.float64] | None, NDArray[np.float64] | None, float | None]:
+        """Interpolate the samples around time t (clamped to the move)."""
+        heads, antennas, body_yaw, samples_per_s = self._frames
+
+        position = min(max(t, 0.0), self._duration) * samples_per_s
+        i = min(int(position), heads.shape[0] - 2)
+        frac = position - i
+        head = self._head
+        np.subtract(heads[i + 1], heads[i], out=head)
+        head *= frac
+        head += heads[i]
+        a0, a1 = antennas[i], antennas[i + 1]
+        self._antennas[0] = a0[0] + frac * (a1[0] - a0[0])
+        self._antennas[1] = a0[1] + frac * (a1[1] - a0[1])
+        yaw = float(body_yaw[i] + frac * (body_yaw[i + 1] - body_yaw[i]))
+        return (head, self._antennas, yaw)
+
+
+class PresampledMove(DenseTrajectoryMove):
+    """Finite move served from a dense trajectory sampled off the control thread.
+
+    `sample()` evaluates the wrapped move at (at least) the control rate and
+    publishes the arrays in one assignment. Until then `evaluate` falls back
+    to the wrapped move; afterwards it only interpolates, so its cost no
+    longer depends on the move.
+
+    Moves made by `instance()` share their template's samples: sampling any
+    of them samples the template (once, under its lock), and the others
+    adopt the arrays once they are published.
+    """
+
+    def __init__(
+        self,
+        source: Move,
+        rate_hz: float = CONTROL_LOOP_FREQUENCY_HZ,
+        template: PresampledMove | None = None,
+    ):
+        """Wrap `source`, which must have a finite, positive duration."""
+        super().__init__(float(source.duration))
+        self.source = source
+        self.rate_hz = rate_hz
+        self._template = template
+        self._sample_lock = threading.Lock()
+
+    def _adopt_frames(self) -> Tuple[NDArray[np.floating], NDArray[np.floating], NDArray[np.floating], float] | None:
+        if self._frames is None and self._template is not None:
+            self._frames = self._template._frames
+        return self._frames
+
+    @property
+    def is_sampled(self) -> bool:
+        """True once the dense trajectory is in use."""
+        return self._adopt_frames() is not None
+
+    def sample(self) -> None:
+        """Evaluate the wrapped move densely; meant to run on a background thread."""
+        if self._template is not None:
+            if not self.is_sampled:
+                self._template.sample()
+                self._adopt_frames()
+            return
+        # Concurrent callers (warm-up, presample executor) wait for one pass
+        with self._sample_lock:
+            if self._frames is None:
+                self._publish_frames(*sample_dense_trajectory(self.source, self.rate_hz, yield_gil=True))
+
+    def instance(self) -> PresampledMove:
+        """Return a new move over this move's samples, with its own output buffers."""
+        return PresampledMove(self.source, self.rate_hz, template=self._template or self)
+
+    def evaluate(self, t: float) -> tuple[NDArray[np.float64] | None, NDArray[np.float64] | None, float | None]:
+        """Interpolate the dense trajectory at time t (live evaluation until sampled)."""
+        if self._adopt_frames() is None:
+            return self.source.evaluate(t)
+        return super().evaluate(t)
+
+
+class SpeechOffsetTrajectory:
+    """Ring of timestamped speech offsets, sampled by the control loop.
+
+    Producers append rows of `(t, x, y, z, roll, pitch, yaw)` with increasing
+    `time.monotonic()` timestamps, ahead of time. The control loop calls
+    `sample(now)` once per tick and gets the offsets interpolated at that
+    exact time, so sway follows the control clock instead of the producer's
+    own sleep schedule. When the ring is full the oldest rows are dropped.
+    """
+
+    def __init__(self, capacity: int = SPEECH_TRAJECTORY_CAPACITY):
+        """Preallocate the ring."""
+        self._rows: NDArray[np.float64] = np.zeros((capacity, 7), dtype=np.float64)
+        self._lock = threading.Lock()
+        self._start = 0
+        self._count = 0
+        self._held = False  # the final row has already been returned once
+
+    def extend(self, times: NDArray[np.float64], offsets: NDArray[np.float64]) -> None:
+        """Append `offsets` (n, 6) scheduled at monotonic `times` (n,)."""
+        n = len(times)
+        if n == 0:
+            return
+        capacity = self._rows.shape[0]
+        if n > capacity:
+            times, offsets, n = times[-capacity:], offsets[-capacity:], capacity
+        with self._lock:
+            overflow = max(0, self._count + n - capacity)
+            self._start = (self._start + overflow) % capacity
+            self._count -= overflow
+            end = (self._start + self._count) % capacity
+            first = min(n, capacity - end)
+            self._rows[end : end + first, 0] = times[:first]
+            self._rows[end : end + first, 1:] = offsets[:first]
+            self._rows[: n - first, 0] = times[first:]
+            self._rows[: n - first, 1:] = offsets[first:]
+            self._count += n
+            self._held = False
+
+    def is_active(self) -> bool:
+        """Return True while rows remain that `sample` has not finished returning."""
+        return self._count > 1 or (self._count == 1 and not self._held)
+
+    def clear(self) -> None:
+        """Drop every scheduled row."""
+        with self._lock:
+            self._start = 0
+            self._count = 0
+            self._held = False
+
+    def sample(self, t: float) -> Tuple[float, float, float, float, float, float] | None:
+        """Return the offsets at time `t`, or None when there is nothing new.
+
+        Rows are linearly interpolated; past the last row (or across a gap
+        longer than SPEECH_TRAJECTORY_MAX_GAP_S) the last value is returned
+        once and then held by the caller.
+        """
+        with self._lock:
+            if not self._count:
+                return None
+            rows = self._rows
+            capacity = rows.shape[0]
+            # drop rows superseded at t, keeping the latest one at or before t
+            while self._count > 1 and rows[(self._start + 1) % capacity, 0] <= t:
+                self._start = (self._start + 1) % capacity
+                self._count -= 1
+                self._held = False
+
+            current = rows[self._start]
+            if t < current[0]:
+                return None
+            if self._count > 1:
+                following = rows[(self._start + 1) % capacity]
+                span = following[0] - current[0]
+                if span <= SPEECH_TRAJECTORY_MAX_GAP_S:
+                    offsets = current[1:] + (following[1:] - current[1:]) * ((t - current[0]) / span)
+                    return tuple(offsets.tolist())  # type: ignore[return-value]
+            if self._held:
+                return None
+            self._held = True
+            return tuple(current[1:].tolist())  # type: ignore[return-value]
+
+
 def combine_full_body(primary_pose: FullBodyPose, secondary_pose: FullBodyPose) -> FullBodyPose:
     """Combine primary and secondary full body poses.
 
@@ -165,6 +449,113 @@ def clone_full_body_pose(pose: FullBodyPose) -> FullBodyPose:
     return (head.copy(), (float(antennas[0]), float(antennas[1])), float(body_yaw))
 
 
+def write_head_pose(
+    out: NDArray[np.float64], x: float, y: float, z: float, roll: float, pitch: float, yaw: float,
+) -> None:
+    """Write `create_head_pose(x, y, z, roll, pitch, yaw, mm=False, degrees=False)` into `out`.
+
+    Closed form of R = Rz(yaw) @ Ry(pitch) @ Rx(roll); only the top three
+    rows of `out` are written, the caller keeps the last row at (0, 0, 0, 1).
+    """
+    cr, sr = math.cos(roll), math.sin(roll)
+    cp, sp = math.cos(pitch), math.sin(pitch)
+    cy, sy = math.cos(yaw), math.sin(yaw)
+    out[0, 0] = cy * cp
+    out[0, 1] = cy * sp * sr - sy * cr
+    out[0, 2] = cy * sp * cr + sy * sr
+    out[0, 3] = x
+    out[1, 0] = sy * cp
+    out[1, 1] = sy * sp * sr + cy * cr
+    out[1, 2] = sy * sp * cr - cy * sr
+    out[1, 3] = y
+    out[2, 0] = -sp
+    out[2, 1] = cp * sr
+    out[2, 2] = cp * cr
+    out[2, 3] = z
+
+
+class TickPoseBuffers:
+    """Preallocated head poses for one control tick, composed in place.
+
+    `primary` is filled by the caller and `secondary` through
+    `set_secondary()`, which reuses the rotation while the angles are
+    unchanged and flags the all-zero offset. `compose()` writes
+    `compose_world_offset(primary, secondary, reorthonormalize=True)` into
+    whichever of the two output buffers is not published, and `publish()`
+    swaps them once the pose was sent. The published buffer backs the
+    commanded-pose snapshot and is never written. Slice views are taken
+    once here, so a tick allocates no arrays. With a zero offset the
+    composition is the identity and `compose()` skips the product, but the
+    primary rotation still goes through the same correction: interpolated
+    primaries (e.g. `DenseTrajectoryMove`) are not exactly orthonormal.
+
+    The SVD re-orthonormalization is replaced by one Newton-Schulz step,
+    R <- R (3 I - R^T R) / 2, which matches the polar factor to second order
+    for the near-orthonormal products seen here.
+    """
+
+    def __init__(self) -> None:
+        """Allocate the buffers and their views."""
+        self.primary = np.eye(4, dtype=np.float64)
+        self.secondary = np.eye(4, dtype=np.float64)
+        self.outputs = (np.eye(4, dtype=np.float64), np.eye(4, dtype=np.float64))
+        self._published = 0
+        self._secondary_angles: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+        self._secondary_is_identity = True
+        self._identity_rows = np.eye(4, dtype=np.float64)[:3]
+
+        self._rotation = np.empty((3, 3), dtype=np.float64)
+        self._rotation_t = self._rotation.T
+        self._gram = np.empty((3, 3), dtype=np.float64)
+        self._correction = np.empty((3, 3), dtype=np.float64)
+        self._primary_r, self._primary_t = self.primary[:3, :3], self.primary[:3, 3]
+        self._secondary_r, self._secondary_t = self.secondary[:3, :3], self.secondary[:3, 3]
+        self._output_views = tuple((out[:3, :3], out[:3, 3]) for out in self.outputs)
+
+    def set_secondary(self, x: float, y: float, z: float, roll: float, pitch: float, yaw: float) -> None:
+        """Write the secondary offset pose, recomputing trig only when the angles change."""
+        if roll == 0.0 and pitch == 0.0 and yaw == 0.0 and x == 0.0 and y == 0.0 and z == 0.0:
+            if not self._secondary_is_identity:
+                self.secondary[:3] = self._identity_rows
+                self._secondary_angles = (0.0, 0.0, 0.0)
+                self._secondary_is_identity = True
+            return
+        self._secondary_is_identity = False
+        angles = (roll, pitch, yaw)
+        if angles == self._secondary_angles:
+            secondary = self.secondary
+            secondary[0, 3] = x
+            secondary[1, 3] = y
+            secondary[2, 3] = z
+        else:
+            write_head_pose(self.secondary, x, y, z, roll, pitch, yaw)
+            self._secondary_angles = angles
+
+    def compose(self) -> NDArray[np.float64]:
+        """Compose secondary onto primary into the unpublished buffer and return it."""
+        index = 1 - self._published
+        out_r, out_t = self._output_views[index]
+        rotation, gram, correction = self._rotation, self._gram, self._correction
+
+        if self._secondary_is_identity:
+            # Zero offset: the composition is the primary pose itself
+            np.copyto(rotation, self._primary_r)
+            np.copyto(out_t, self._primary_t)
+        else:
+            np.matmul(self._secondary_r, self._primary_r, rotation)
+            np.add(self._primary_t, self._secondary_t, out_t)
+        np.matmul(self._rotation_t, rotation, gram)
+        np.matmul(rotation, gram, correction)
+        np.multiply(rotation, 1.5, rotation)
+        np.multiply(correction, 0.5, correction)
+        np.subtract(rotation, correction, out_r)
+        return self.outputs[index]
+
+    def publish(self) -> None:
+        """Mark the last composed output as published (swap the double buffer)."""
+        self._published = 1 - self._published
+
+
 @dataclass
 class MovementState:
     """State tracking for the movement system."""
@@ -210,15 +601,74 @@ class LoopFrequencyStats:
     count: int = 0
     last_freq: float = 0.0
     potential_freq: float = 0.0
+    missed_deadlines: int = 0  # cumulative, not cleared by reset()
 
     def reset(self) -> None:
-        """Reset accumulators while keeping the last potential frequency."""
+        """Reset accumulators while keeping the last potential frequency and missed deadlines."""
         self.mean = 0.0
         self.m2 = 0.0
         self.min_freq = float("inf")
         self.count = 0
 
 
+class StageLatencyHistograms:
+    """Fixed-bucket latency histograms, one per control-loop stage.
+
+    `record` is a bisect and an in-place counter increment (C `array`s, so
+    counts never become live Python objects), cheap enough for every tick.
+    The worker summarises and clears them once per window; readers only see
+    the published summary.
+    """
+
+    def __init__(self, stages: Tuple[str, ...] = TICK_STAGES):
+        """Allocate empty histograms with geometric bucket edges."""
+        self.stages = stages
+        self._edges = np.geomspace(LATENCY_BUCKET_MIN_S, LATENCY_BUCKET_MAX_S, LATENCY_BUCKET_COUNT).tolist()
+        self._counts = [array("q", bytes(8 * (len(self._edges) + 1))) for _ in stages]
+        self._max = [0.0] * len(stages)
+
+    def record(self, stage: int, seconds: float) -> None:
+        """Count one `seconds` sample for the stage at index `stage`."""
+        self._counts[stage][bisect.bisect_left(self._edges, seconds)] += 1
+        if seconds > self._max[stage]:
+            self._max[stage] = seconds
+
+    def reset(self) -> None:
+        """Start a new window."""
+        self._counts = [array("q", bytes(8 * (len(self._edges) + 1))) for _ in self.stages]
+        self._max = [0.0] * len(self.stages)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Return count, p50, p99 and max (milliseconds) per stage.
+
+        Percentiles are bucket upper edges, i.e. accurate to one bucket width;
+        the overflow bucket reports the window maximum.
+        """
+        result: Dict[str, Dict[str, float]] = {}
+        for stage, counts in enumerate(self._counts):
+            total = sum(counts)
+            result[self.stages[stage]] = {
+                "count": total,
+                "p50_ms": self._percentile(stage, counts, total, 0.50) * 1e3,
+                "p99_ms": self._percentile(stage, counts, total, 0.99) * 1e3,
+                "max_ms": self._max[stage] * 1e3,
+            }
+        return result
+
+    def _percentile(self, stage: int, counts: array, total: int, q: float) -> float:
+        if total == 0:
+            return 0.0
+        rank = q * total
+        cumulative = 0
+        for bucket, count in enumerate(counts):
+            cumulative += count
+            if cumulative >= rank:
+                if bucket < len(self._edges):
+                    return min(self._edges[bucket], self._max[stage])
+                break
+        return self._max[stage]
+
+
 class MovementManager:
     """Coordinate sequential moves, additive offsets, and robot output at 100 Hz.
 
@@ -256,8 +706,11 @@ class MovementManager:
         # Movement state
         self.state = MovementState()
         self.state.last_activity_time = self._now()
-        neutral_pose = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
-        self.state.last_primary_pose = (neutral_pose, (0.0, 0.0), 0.0)
+        # Preallocated per-tick poses; the primary buffer backs last_primary_pose
+        self._pose_buffers = TickPoseBuffers()
+        self._neutral_head_pose = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
+        np.copyto(self._pose_buffers.primary, self._neutral_head_pose)
+        self.state.last_primary_pose = (self._pose_buffers.primary, (0.0, 0.0), 0.0)
 
         # Move queue (primary moves)
         self.move_queue: deque[Move] = deque()
@@ -266,9 +719,24 @@ class MovementManager:
         self.idle_inactivity_delay = 0.3  # seconds
         self.target_frequency = CONTROL_LOOP_FREQUENCY_HZ
         self.target_period = 1.0 / self.target_frequency
+        self.rate_periods = {
+            RATE_FULL: self.target_period,
+            RATE_BREATHING: 1.0 / BREATHING_LOOP_FREQUENCY_HZ,
+            RATE_NO_SESSION: 1.0 / NO_SESSION_LOOP_FREQUENCY_HZ,
+        }
+        self._rate_tier = RATE_FULL
+        self._session_active = True
+        self.spin_threshold = 0.0  # seconds busy-waited before each deadline (0 = sleep only)
+        self.overrun_policy = OVERRUN_SKIP
+        self.max_catch_up_ticks = 5  # beyond this many late slots, catch_up skips too
 
         self._stop_event = threading.Event()
+        # Set by producers so that a slow-rate loop reacts without waiting a period
+        self._wake_event = threading.Event()
         self._thread: threading.Thread | None = None
+        # Background sampling of queued finite moves (runs while the worker does)
+        self.presample_moves = True
+        self._presample_executor: ThreadPoolExecutor | None = None
         self._is_listening = False
         self._last_commanded_pose: FullBodyPose = clone_full_body_pose(self.state.last_primary_pose)
         self._listening_antennas: Tuple[float, float] = self._last_commanded_pose[1]
@@ -282,6 +750,16 @@ class MovementManager:
         self._set_target_err_interval = 1.0  # seconds between error logs
         self._set_target_err_suppressed = 0
 
+        # Deadband: skip set_target while the pose is static (off by default)
+        self.command_deadband = False
+        self.deadband_head_tolerance = DEADBAND_HEAD_TOLERANCE
+        self.deadband_antenna_tolerance = DEADBAND_ANTENNA_TOLERANCE
+        self.deadband_body_yaw_tolerance = DEADBAND_BODY_YAW_TOLERANCE
+        self.deadband_keepalive = DEADBAND_KEEPALIVE_S
+        self._last_set_target_time = float("-inf")
+        self._suppressed_commands = 0
+        self._head_delta = np.empty((4, 4), dtype=np.float64)
+
         # Cross-thread signalling
         self._command_queue: "Queue[Tuple[str, Any]]" = Queue()
         self._speech_offsets_lock = threading.Lock()
@@ -294,6 +772,8 @@ class MovementManager:
             0.0,
         )
         self._speech_offsets_dirty = False
+        self.speech_trajectory = SpeechOffsetTrajectory()
+        self._speech_from_trajectory = False  # state.speech_offsets came from the trajectory
 
         self._face_offsets_lock = threading.Lock()
         self._pending_face_offsets: Tuple[float, float, float, float, float, float] = (
@@ -312,21 +792,71 @@ class MovementManager:
         self._status_lock = threading.Lock()
         self._freq_stats = LoopFrequencyStats()
         self._freq_snapshot = LoopFrequencyStats()
+        self._stage_latency = StageLatencyHistograms()
+        self._stage_latency_snapshot: Dict[str, Dict[str, float]] = self._stage_latency.summary()
 
     def queue_move(self, move: Move) -> None:
         """Queue a primary move to run after the currently executing one.
 
         Thread-safe: the move is enqueued via the worker command queue so the
-        control loop remains the sole mutator of movement state.
+        control loop remains the sole mutator of movement state. Finite moves
+        are wrapped in a `PresampledMove` and sampled on a background thread
+        while they wait (see `presample_moves`).
         """
-        self._command_queue.put(("queue_move", move))
+        self._post_command("queue_move", self._presample(move))
+
+    def _presample(self, move: Move) -> Move:
+        """Wrap a finite move and schedule its dense sampling, if enabled."""
+        executor = self._presample_executor
+        if not self.presample_moves or executor is None:
+            return move
+        if isinstance(move, PresampledMove):
+            # Registry instance: samples (or adopts) its shared template
+            if move.is_sampled:
+                return move
+            presampled = move
+        elif isinstance(move, DenseTrajectoryMove) or not getattr(move, "presample", True):
+            return move
+        else:
+            try:
+                duration = float(move.duration)
+            except (AttributeError, TypeError, ValueError):
+                return move
+            if not 0.0 < duration <= PRESAMPLE_MAX_DURATION_S:
+                return move
+            presampled = PresampledMove(move, self.target_frequency)
+
+        def sample() -> None:
+            try:
+                presampled.sample()
+            except Exception as e:
+                logger.warning("Pre-sampling %s failed, evaluating it live: %s", type(move).__name__, e)
+
+        try:
+            executor.submit(sample)
+        except RuntimeError:  # executor shut down by a concurrent stop()
+            return move
+        return presampled
 
     def clear_move_queue(self) -> None:
         """Stop the active move and discard any queued primary moves.
 
         Thread-safe: executed by the worker thread via the command queue.
         """
-        self._command_queue.put(("clear_queue", None))
+        self._post_command("clear_queue", None)
+
+    def _post_command(self, command: str, payload: Any) -> None:
+        """Hand a command to the worker and wake it up."""
+        self._command_queue.put((command, payload))
+        self._wake_event.set()
+
+    def set_session_active(self, active: bool) -> None:
+        """Tell the manager whether a client session is running.
+
+        Without a session idle breathing settles to a static neutral pose and
+        the loop drops to a trickle rate. Thread-safe via the command queue.
+        """
+        self._post_command("set_session_active", active)
 
     def set_speech_offsets(self, offsets: Tuple[float, float, float, float, float, float]) -> None:
         """Update speech-induced secondary offsets (x, y, z, roll, pitch, yaw).
@@ -337,6 +867,21 @@ class MovementManager:
         with self._speech_offsets_lock:
             self._pending_speech_offsets = offsets
             self._speech_offsets_dirty = True
+        self._wake_event.set()
+
+    def queue_speech_offsets(self, times: NDArray[np.float64], offsets: NDArray[np.float64]) -> None:
+        """Schedule speech offsets rows (n, 6) at monotonic `times` (n,).
+
+        The control loop samples them at tick time (see `SpeechOffsetTrajectory`).
+        Thread-safe.
+        """
+        self.speech_trajectory.extend(times, offsets)
+        self._wake_event.set()
+
+    def clear_speech_offsets(self) -> None:
+        """Discard scheduled speech offsets and return the sway to rest. Thread-safe."""
+        self.speech_trajectory.clear()
+        self.set_speech_offsets(ZERO_OFFSETS)
 
     def set_moving_state(self, duration: float) -> None:
         """Mark the robot as actively moving for the provided duration.
@@ -344,7 +889,7 @@ class MovementManager:
         Legacy hook used by goto helpers to keep inactivity and breathing logic
         aware of manual motions. Thread-safe via the command queue.
         """
-        self._command_queue.put(("set_moving_state", duration))
+        self._post_command("set_moving_state", duration)
 
     def is_idle(self) -> bool:
         """Return True when the robot has been inactive longer than the idle delay."""
@@ -370,20 +915,21 @@ class MovementManager:
         with self._shared_state_lock:
             if self._shared_is_listening == listening:
                 return
-        self._command_queue.put(("set_listening", listening))
+        self._post_command("set_listening", listening)
 
     def _poll_signals(self, current_time: float) -> None:
         """Apply queued commands and pending offset updates."""
-        self._apply_pending_offsets()
+        self._apply_pending_offsets(current_time)
 
-        while True:
+        # Single consumer: skip the Empty exception on the common no-command tick
+        while self._command_queue.qsize():
             try:
                 command, payload = self._command_queue.get_nowait()
             except Empty:
                 break
             self._handle_command(command, payload, current_time)
 
-    def _apply_pending_offsets(self) -> None:
+    def _apply_pending_offsets(self, current_time: float) -> None:
         """Apply the most recent speech/face offset updates."""
         speech_offsets: Tuple[float, float, float, float, float, float] | None = None
         with self._speech_offsets_lock:
@@ -391,6 +937,16 @@ class MovementManager:
                 speech_offsets = self._pending_speech_offsets
                 self._speech_offsets_dirty = False
 
+        # Scheduled sway, sampled at this tick's time
+        scheduled = self.speech_trajectory.sample(current_time)
+        if scheduled is not None:
+            speech_offsets = scheduled
+            self._speech_from_trajectory = True
+        elif self._speech_from_trajectory and not self.speech_trajectory.is_active():
+            # Drained: the sway comes to rest rather than holding its last tilt
+            speech_offsets = ZERO_OFFSETS
+            self._speech_from_trajectory = False
+
         if speech_offsets is not None:
             self.state.speech_offsets = speech_offsets
             self.state.update_activity()
@@ -439,6 +995,15 @@ class MovementManager:
                 logger.warning("Invalid moving state duration: %s", payload)
                 return
             self.state.update_activity()
+        elif command == "set_session_active":
+            self._session_active = bool(payload)
+            self.state.update_activity()
+            move = self.state.current_move
+            if isinstance(move, BreathingMove) and move.breathe != self._session_active:
+                # Restart idle breathing (after the idle delay) in the new mode
+                self.state.current_move = None
+                self.state.move_start_time = None
+                self._breathing_active = False
         elif command == "mark_activity":
             self.state.update_activity()
         elif command == "set_listening":
@@ -508,10 +1073,13 @@ class MovementManager:
                     self._breathing_active = True
                     self.state.update_activity()
 
+                    # Without a client the loop may trickle at the no-session
+                    # rate, which cannot render the sway: settle to neutral
                     breathing_move = BreathingMove(
                         interpolation_start_pose=current_head_pose,
                         interpolation_start_antennas=current_antennas,
                         interpolation_duration=1.0,
+                        breathe=self._session_active,
                     )
                     self.move_queue.append(breathing_move)
                     logger.debug("Started breathing after %.1fs of inactivity", idle_for)
@@ -529,67 +1097,65 @@ class MovementManager:
             self._breathing_active = False
 
     def _get_primary_pose(self, current_time: float) -> FullBodyPose:
-        """Get the primary full body pose from current move or neutral."""
+        """Get the primary full body pose from current move or neutral.
+
+        The head is written into the preallocated primary buffer, which also
+        backs `state.last_primary_pose`; callers must treat it as read-only.
+        """
+        primary_head = self._pose_buffers.primary
+
         # When a primary move is playing, sample it and cache the resulting pose
         if self.state.current_move is not None and self.state.move_start_time is not None:
             move_time = current_time - self.state.move_start_time
             head, antennas, body_yaw = self.state.current_move.evaluate(move_time)
 
-            if head is None:
-                head = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
-            if antennas is None:
-                antennas = np.array([0.0, 0.0])
-            if body_yaw is None:
-                body_yaw = 0.0
-
-            antennas_tuple = (float(antennas[0]), float(antennas[1]))
-            head_copy = head.copy()
-            primary_full_body_pose = (
-                head_copy,
+            np.copyto(primary_head, self._neutral_head_pose if head is None else head)
+            antennas_tuple = (0.0, 0.0) if antennas is None else (float(antennas[0]), float(antennas[1]))
+            self.state.last_primary_pose = (
+                primary_head,
                 antennas_tuple,
-                float(body_yaw),
+                0.0 if body_yaw is None else float(body_yaw),
             )
-
-            self.state.last_primary_pose = clone_full_body_pose(primary_full_body_pose)
         # Otherwise reuse the last primary pose so we avoid jumps between moves
         elif self.state.last_primary_pose is not None:
-            primary_full_body_pose = clone_full_body_pose(self.state.last_primary_pose)
+            last_head, last_antennas, last_body_yaw = self.state.last_primary_pose
+            if last_head is not primary_head:
+                np.copyto(primary_head, last_head)
+                self.state.last_primary_pose = (primary_head, last_antennas, last_body_yaw)
         else:
-            neutral_head_pose = create_head_pose(0, 0, 0, 0, 0, 0, degrees=True)
-            primary_full_body_pose = (neutral_head_pose, (0.0, 0.0), 0.0)
-            self.state.last_primary_pose = clone_full_body_pose(primary_full_body_pose)
+            np.copyto(primary_head, self._neutral_head_pose)
+            self.state.last_primary_pose = (primary_head, (0.0, 0.0), 0.0)
 
-        return primary_full_body_pose
+        return self.state.last_primary_pose
 
     def _get_secondary_pose(self) -> FullBodyPose:
         """Get the secondary full body pose from speech and face tracking offsets."""
         # Combine speech sway offsets + face tracking offsets for secondary pose
-        secondary_offsets = [
-            self.state.speech_offsets[0] + self.state.face_tracking_offsets[0],
-            self.state.speech_offsets[1] + self.state.face_tracking_offsets[1],
-            self.state.speech_offsets[2] + self.state.face_tracking_offsets[2],
-            self.state.speech_offsets[3] + self.state.face_tracking_offsets[3],
-            self.state.speech_offsets[4] + self.state.face_tracking_offsets[4],
-            self.state.speech_offsets[5] + self.state.face_tracking_offsets[5],
-        ]
-
-        secondary_head_pose = create_head_pose(
-            x=secondary_offsets[0],
-            y=secondary_offsets[1],
-            z=secondary_offsets[2],
-            roll=secondary_offsets[3],
-            pitch=secondary_offsets[4],
-            yaw=secondary_offsets[5],
-            degrees=False,
-            mm=False,
+        speech = self.state.speech_offsets
+        face = self.state.face_tracking_offsets
+        self._pose_buffers.set_secondary(
+            speech[0] + face[0],
+            speech[1] + face[1],
+            speech[2] + face[2],
+            speech[3] + face[3],
+            speech[4] + face[4],
+            speech[5] + face[5],
         )
-        return (secondary_head_pose, (0.0, 0.0), 0.0)
+        return (self._pose_buffers.secondary, (0.0, 0.0), 0.0)
 
     def _compose_full_body_pose(self, current_time: float) -> FullBodyPose:
-        """Compose primary and secondary poses into a single command pose."""
-        primary = self._get_primary_pose(current_time)
-        secondary = self._get_secondary_pose()
-        return combine_full_body(primary, secondary)
+        """Compose primary and secondary poses into a single command pose.
+
+        Same result as `combine_full_body`, written into preallocated buffers.
+        """
+        _, primary_antennas, primary_body_yaw = self._get_primary_pose(current_time)
+        _, secondary_antennas, secondary_body_yaw = self._get_secondary_pose()
+        combined_head = self._pose_buffers.compose()
+        combined_antennas = (
+            primary_antennas[0] + secondary_antennas[0],
+            primary_antennas[1] + secondary_antennas[1],
+        )
+        return (combined_head, combined_antennas, primary_body_yaw + secondary_body_yaw)
 
     def _update_primary_motion(self, current_time: float) -> None:
         """Advance queue state and idle behaviours for this tick."""
@@ -632,8 +1198,33 @@ class MovementManager:
 
         return antennas_cmd
 
+    def _within_deadband(self, head: NDArray[np.float64], antennas: Tuple[float, float], body_yaw: float) -> bool:
+        """Return True when the pose is within tolerance of the last command sent."""
+        last_head, last_antennas, last_body_yaw = self._last_commanded_pose
+        if (
+            abs(antennas[0] - last_antennas[0]) > self.deadband_antenna_tolerance
+            or abs(antennas[1] - last_antennas[1]) > self.deadband_antenna_tolerance
+            or abs(body_yaw - last_body_yaw) > self.deadband_body_yaw_tolerance
+        ):
+            return False
+        delta = self._head_delta
+        np.subtract(head, last_head, delta)
+        np.abs(delta, delta)
+        return bool(delta.max() <= self.deadband_head_tolerance)
+
     def _issue_control_command(self, head: NDArray[np.float32], antennas: Tuple[float, float], body_yaw: float) -> None:
-        """Send the fused pose to the robot with throttled error logging."""
+        """Send the fused pose to the robot with throttled error logging.
+
+        With `command_deadband` on, a pose within tolerance of the last one
+        sent is dropped unless `deadband_keepalive` seconds have passed.
+        """
+        if self.command_deadband:
+            now = self._now()
+            if now - self._last_set_target_time < self.deadband_keepalive and self._within_deadband(
+                head, antennas, body_yaw,
+            ):
+                self._suppressed_commands += 1
+                return
         try:
             self.current_robot.set_target(head=head, antennas=antennas, body_yaw=body_yaw)
         except Exception as e:
@@ -648,8 +1239,13 @@ class MovementManager:
             else:
                 self._set_target_err_suppressed += 1
         else:
+            # `head` is the composed output buffer; publishing swaps the double
+            # buffer so the next tick composes into the other one
             with self._status_lock:
-                self._last_commanded_pose = clone_full_body_pose((head, antennas, body_yaw))
+                self._last_commanded_pose = (head, antennas, body_yaw)
+                self._pose_buffers.publish()
+            if self.command_deadband:
+                self._last_set_target_time = now
 
     def _update_frequency_stats(
         self, loop_start: float, prev_loop_start: float, stats: LoopFrequencyStats,
@@ -665,42 +1261,124 @@ class MovementManager:
             stats.min_freq = min(stats.min_freq, stats.last_freq)
         return stats
 
-    def _schedule_next_tick(self, loop_start: float, stats: LoopFrequencyStats) -> Tuple[float, LoopFrequencyStats]:
-        """Compute sleep time to maintain target frequency and update potential freq."""
-        computation_time = self._now() - loop_start
+    def _schedule_next_tick(
+        self, loop_start: float, deadline: float, stats: LoopFrequencyStats, period: float,
+    ) -> float:
+        """Return the absolute deadline of the next tick and update potential freq.
+
+        Deadlines stay on the `t0 + k * period` grid (`period` is the current
+        rate tier's). When the next one has
+        already passed, the missed slots are counted and handled per
+        `overrun_policy`: `skip` moves to the next future slot, `catch_up`
+        runs immediately (unless more than `max_catch_up_ticks` behind).
+        """
+        now = self._now()
+        computation_time = now - loop_start
         stats.potential_freq = 1.0 / computation_time if computation_time > 0 else float("inf")
-        sleep_time = max(0.0, self.target_period - computation_time)
-        return sleep_time, stats
+
+        deadline += period
+        if now <= deadline:
+            return deadline
+
+        late_slots = int((now - deadline) / period) + 1
+        if self.overrun_policy == OVERRUN_CATCH_UP and late_slots <= self.max_catch_up_ticks:
+            stats.missed_deadlines += 1
+            return deadline
+        stats.missed_deadlines += late_slots
+        return deadline + late_slots * period
+
+    def _select_rate_tier(self, current_time: float) -> str:
+        """Pick the loop rate tier from what is currently moving.
+
+        Breathing only counts as reduced-rate once its interpolation back to
+        neutral is over; that blend runs at the full rate like any other move.
+        """
+        move = self.state.current_move
+        if (
+            (move is not None and not self._in_steady_breathing(move, current_time))
+            or self.move_queue
+            or self.speech_trajectory.is_active()
+            or any(self.state.face_tracking_offsets)
+            or (not self._is_listening and self._antenna_unfreeze_blend < 1.0)
+        ):
+            return RATE_FULL
+        # The trickle rate is only safe for a static pose, not breathing sway
+        if not self._session_active and (move is None or not move.breathe):
+            return RATE_NO_SESSION
+        return RATE_BREATHING
+
+    def _in_steady_breathing(self, move: Move, current_time: float) -> bool:
+        """Whether `move` is a breathing move past its interpolation phase."""
+        if not isinstance(move, BreathingMove) or self.state.move_start_time is None:
+            return False
+        return current_time - self.state.move_start_time >= move.interpolation_duration
+
+    def _sleep_until(self, deadline: float, wakeable: bool = False) -> bool:
+        """Sleep until `deadline`, spinning through the last `spin_threshold` seconds.
+
+        When `wakeable` (reduced rate tiers), producers can cut the sleep
+        short; returns True in that case.
+        """
+        remaining = deadline - self._now()
+        if remaining > self.spin_threshold:
+            if wakeable:
+                if self._wake_event.wait(remaining - self.spin_threshold):
+                    return True
+            else:
+                time.sleep(remaining - self.spin_threshold)
+        if self.spin_threshold > 0:
+            while self._now() < deadline:
+                pass
+        return False
 
     def _record_frequency_snapshot(self, stats: LoopFrequencyStats) -> None:
         """Store a thread-safe snapshot of current frequency statistics."""
+        snapshot = self._freq_snapshot
         with self._status_lock:
-            self._freq_snapshot = LoopFrequencyStats(
-                mean=stats.mean,
-                m2=stats.m2,
-                min_freq=stats.min_freq,
-                count=stats.count,
-                last_freq=stats.last_freq,
-                potential_freq=stats.potential_freq,
-            )
-
-    def _maybe_log_frequency(self, loop_count: int, print_interval_loops: int, stats: LoopFrequencyStats) -> None:
-        """Emit frequency telemetry when enough loops have elapsed."""
-        if loop_count % print_interval_loops != 0 or stats.count == 0:
-            return
+            snapshot.mean = stats.mean
+            snapshot.m2 = stats.m2
+            snapshot.min_freq = stats.min_freq
+            snapshot.count = stats.count
+            snapshot.last_freq = stats.last_freq
+            snapshot.potential_freq = stats.potential_freq
+            snapshot.missed_deadlines = stats.missed_deadlines
+
+    def _maybe_log_frequency(self, current_time: float, log_deadline: float, stats: LoopFrequencyStats) -> float:
+        """Emit frequency telemetry once `log_deadline` has passed; return the next deadline."""
+        if current_time < log_deadline:
+            return log_deadline
+        next_deadline = current_time + FREQUENCY_LOG_INTERVAL_S
+        if stats.count == 0:
+            return next_deadline
 
         variance = stats.m2 / stats.count if stats.count > 0 else 0.0
         lowest = stats.min_freq if stats.min_freq != float("inf") else 0.0
         logger.debug(
-            "Loop freq - avg: %.2fHz, variance: %.4f, min: %.2fHz, last: %.2fHz, potential: %.2fHz, target: %.1fHz",
+            "Loop freq - avg: %.2fHz, variance: %.4f, min: %.2fHz, last: %.2fHz, potential: %.2fHz, target: %.1fHz (%s), missed deadlines: %d",
             stats.mean,
             variance,
             lowest,
             stats.last_freq,
             stats.potential_freq,
-            self.target_frequency,
+            1.0 / self.rate_periods[self._rate_tier],
+            self._rate_tier,
+            stats.missed_deadlines,
         )
         stats.reset()
+        return next_deadline
+
+    def _maybe_publish_stage_latency(self, current_time: float, window_deadline: float) -> float:
+        """Publish the per-stage latency summary once `window_deadline` has passed.
+
+        Starts a new window and returns its deadline.
+        """
+        if current_time < window_deadline:
+            return window_deadline
+        summary = self._stage_latency.summary()
+        self._stage_latency.reset()
+        with self._status_lock:
+            self._stage_latency_snapshot = summary
+        return current_time + LATENCY_WINDOW_S
 
     def _update_face_tracking(self, current_time: float) -> None:
         """Get face tracking offsets from camera worker thread."""
@@ -718,6 +1396,7 @@ class MovementManager:
             logger.warning("Move worker already running; start() ignored")
             return
         self._stop_event.clear()
+        self._presample_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="move-presample")
         self._thread = threading.Thread(target=self.working_loop, daemon=True)
         self._thread.start()
         logger.debug("Move worker started")
@@ -725,9 +1404,13 @@ class MovementManager:
     def stop(self) -> None:
         """Request the worker thread to stop and wait for it to exit."""
         self._stop_event.set()
+        self._wake_event.set()
         if self._thread is not None:
             self._thread.join()
             self._thread = None
+        if self._presample_executor is not None:
+            self._presample_executor.shutdown(wait=False, cancel_futures=True)
+            self._presample_executor = None
         logger.debug("Move worker stopped")
 
     def get_status(self) -> Dict[str, Any]:
@@ -741,7 +1424,9 @@ class MovementManager:
                 count=self._freq_snapshot.count,
                 last_freq=self._freq_snapshot.last_freq,
                 potential_freq=self._freq_snapshot.potential_freq,
+                missed_deadlines=self._freq_snapshot.missed_deadlines,
             )
+            stage_latency = self._stage_latency_snapshot
 
         head_matrix = pose_snapshot[0].tolist() if pose_snapshot else None
         antennas = pose_snapshot[1] if pose_snapshot else None
@@ -751,6 +1436,9 @@ class MovementManager:
             "queue_size": len(self.move_queue),
             "is_listening": self._is_listening,
             "breathing_active": self._breathing_active,
+            "session_active": self._session_active,
+            "rate_tier": self._rate_tier,
+            "suppressed_commands": self._suppressed_commands,
             "last_commanded_pose": {
                 "head": head_matrix,
                 "antennas": antennas,
@@ -761,23 +1449,71 @@ class MovementManager:
                 "mean": freq_snapshot.mean,
                 "min": freq_snapshot.min_freq,
                 "potential": freq_snapshot.potential_freq,
+                "missed_deadlines": freq_snapshot.missed_deadlines,
                 "samples": freq_snapshot.count,
             },
+            # Last completed window; the summary is replaced, never mutated
+            "stage_latency": stage_latency,
         }
 
+    def _tick(self, current_time: float) -> None:
+        """Run one control tick: fuse the current poses and issue `set_target`.
+
+        Steady-state ticks write into preallocated buffers only (see
+        `benchmarks/tick_allocations.py`).
+        """
+        clock = time.perf_counter
+        latency = self._stage_latency
+        tick_start = clock()
+
+        # 1) Poll external commands and apply pending offsets (atomic snapshot)
+        self._poll_signals(current_time)
+        t_poll = clock()
+        latency.record(STAGE_POLL, t_poll - tick_start)
+
+        # 2) Manage the primary move queue (start new move, end finished move, breathing)
+        self._update_primary_motion(current_time)
+        t_primary = clock()
+        latency.record(STAGE_PRIMARY, t_primary - t_poll)
+
+        # 3) Update vision-based secondary offsets
+        self._update_face_tracking(current_time)
+        t_face = clock()
+        latency.record(STAGE_FACE, t_face - t_primary)
+
+        # 4) Build primary and secondary full-body poses, then fuse them
+        head, antennas, body_yaw = self._compose_full_body_pose(current_time)
+        t_compose = clock()
+        latency.record(STAGE_COMPOSE, t_compose - t_face)
+
+        # 5) Apply listening antenna freeze or blend-back
+        antennas_cmd = self._calculate_blended_antennas(antennas)
+        t_blend = clock()
+        latency.record(STAGE_BLEND, t_blend - t_compose)
+
+        # 6) Single set_target call - the only control point
+        self._issue_control_command(head, antennas_cmd, body_yaw)
+        t_end = clock()
+        latency.record(STAGE_SET_TARGET, t_end - t_blend)
+        latency.record(STAGE_TICK, t_end - tick_start)
+
     def working_loop(self) -> None:
         """Control loop main movements - reproduces main_works.py control architecture.
 
         Single set_target() call with pose fusion.
         """
-        logger.debug("Starting enhanced movement control loop (100Hz)")
+        logger.debug("Starting enhanced movement control loop (%.0fHz)", self.target_frequency)
 
         loop_count = 0
         prev_loop_start = self._now()
-        print_interval_loops = max(1, int(self.target_frequency * 2))
+        # Telemetry windows run on monotonic deadlines, whatever the rate tier
+        log_deadline = prev_loop_start + FREQUENCY_LOG_INTERVAL_S
+        latency_deadline = prev_loop_start + LATENCY_WINDOW_S
         freq_stats = self._freq_stats
+        deadline = prev_loop_start  # first tick runs immediately and sets the phase
 
         while not self._stop_event.is_set():
+            self._wake_event.clear()
             loop_start = self._now()
             loop_count += 1
 
@@ -785,33 +1521,25 @@ class MovementManager:
                 freq_stats = self._update_frequency_stats(loop_start, prev_loop_start, freq_stats)
             prev_loop_start = loop_start
 
-            # 1) Poll external commands and apply pending offsets (atomic snapshot)
-            self._poll_signals(loop_start)
-
-            # 2) Manage the primary move queue (start new move, end finished move, breathing)
-            self._update_primary_motion(loop_start)
-
-            # 3) Update vision-based secondary offsets
-            self._update_face_tracking(loop_start)
-
-            # 4) Build primary and secondary full-body poses, then fuse them
-            head, antennas, body_yaw = self._compose_full_body_pose(loop_start)
-
-            # 5) Apply listening antenna freeze or blend-back
-            antennas_cmd = self._calculate_blended_antennas(antennas)
-
-            # 6) Single set_target call - the only control point
-            self._issue_control_command(head, antennas_cmd, body_yaw)
+            # 1-6) Compute and send this tick's command
+            self._tick(loop_start)
 
-            # 7) Adaptive sleep to align to next tick, then publish shared state
-            sleep_time, freq_stats = self._schedule_next_tick(loop_start, freq_stats)
+            # 7) Pick the rate tier, next absolute deadline (overrun policy applied),
+            #    then publish shared state
+            tier = self._select_rate_tier(loop_start)
+            if tier != self._rate_tier:
+                logger.debug("Control loop rate: %s -> %s", self._rate_tier, tier)
+                self._rate_tier = tier
+            deadline = self._schedule_next_tick(loop_start, deadline, freq_stats, self.rate_periods[tier])
             self._publish_shared_state()
             self._record_frequency_snapshot(freq_stats)
 
-            # 8) Periodic telemetry on loop frequency
-            self._maybe_log_frequency(loop_count, print_interval_loops, freq_stats)
+            # 8) Periodic telemetry on loop frequency and per-stage latency
+            log_deadline = self._maybe_log_frequency(loop_start, log_deadline, freq_stats)
+            latency_deadline = self._maybe_publish_stage_latency(loop_start, latency_deadline)
 
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            if self._sleep_until(deadline, wakeable=tier != RATE_FULL):
+                # Woken by a producer: tick now and restart the phase from here
+                deadline = self._now()
 
         logger.debug("Movement control loop stopped")
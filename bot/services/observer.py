@@ -0,0 +1,79 @@
+"""Pipeline observer that drives the robot without sitting on the audio path."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from pipecat.frames.frames import AudioRawFrame
+from pipecat.observers.base_observer import BaseObserver, FramePushed
+from pipecat.processors.frame_processor import FrameDirection
+from pipecat.transports.base_output import BaseOutputTransport
+
+from .reachy_service import ReachyService
+from .processor import ReachyFrameHandler, connect_service, connect_service_async
+from loguru import logger as loguru_logger
+
+
+class ReachyWobblerObserver(BaseObserver):
+    """Feeds TTS audio and speaking state to the robot as frames flow past.
+
+    Observers see frames after they are pushed and never delay them, so the
+    pipeline delivers audio without waiting on the robot. Robot calls are
+    submitted to a single worker thread, which keeps them ordered and off
+    the event loop even when the Reachy daemon is slow or disconnected.
+
+    Audio is taken from the output transport's own downstream pushes: those
+    are the chunks it has just played, paced in real time, rather than the
+    TTS output that can arrive in bursts well ahead of playback.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.service = ReachyService.get_instance()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reachy-observer")
+        # Connect in the background: robot calls are skipped until it is ready
+        try:
+            self._connect_task = asyncio.get_running_loop().create_task(
+                connect_service_async(self.service, "ReachyWobblerObserver")
+            )
+        except RuntimeError:  # built outside the event loop
+            self._connect_task = None
+            self._executor.submit(connect_service, self.service, "ReachyWobblerObserver")
+        # Every hop is reported, so the handler deduplicates by frame id;
+        # matching on content as well would drop repeated identical chunks
+        # (silence) from the sway timeline
+        self.handler = ReachyFrameHandler(self.service, self._submit, dedup_by_content=False)
+        # Set by cleanup(); the executor is shut down and submissions are dropped
+        self._closed = False
+
+    def _submit(self, fn, *args):
+        if self._closed:
+            return
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._log_failure)
+
+    @staticmethod
+    def _log_failure(future):
+        if future.exception() is not None:
+            loguru_logger.warning(f"ReachyWobblerObserver: robot call failed: {future.exception()}")
+
+    async def cleanup(self):
+        await super().cleanup()
+        self._closed = True
+        # The connection attempt itself is shared and keeps going
+        if self._connect_task is not None:
+            self._connect_task.cancel()
+        # Let queued robot calls finish in the background
+        self._executor.shutdown(wait=False)
+
+    def reset_state(self):
+        """Reset observer state (called on disconnect)."""
+        self.handler.reset_state()
+
+    async def on_push_frame(self, data: FramePushed):
+        # Speaking-state and TTS audio frames all travel downstream; the
+        # upstream copies of the speaking frames would only double-count
+        if self._closed or data.direction != FrameDirection.DOWNSTREAM:
+            return
+        if isinstance(data.frame, AudioRawFrame) and not isinstance(data.source, BaseOutputTransport):
+            return
+        self.handler.handle(data.frame, data.direction)
@@ -1,54 +1,108 @@
-import base64
-import hashlib
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
 from pipecat.processors.frame_processor import FrameProcessor, FrameDirection
 from pipecat.frames.frames import (
     AudioRawFrame, 
     Frame,
     BotStartedSpeakingFrame,
     BotStoppedSpeakingFrame,
+    StartFrame,
     UserStartedSpeakingFrame
 )
 from .reachy_service import ReachyService
 from loguru import logger as loguru_logger
 
-class ReachyWobblerProcessor(FrameProcessor):
-    def __init__(self):
-        super().__init__()
-        self.service = ReachyService.get_instance()
-        # Attempt connection on initialization
-        if not self.service.connected:
-            loguru_logger.info("ReachyWobblerProcessor: Connecting to Reachy...")
-            self.service.connect()
-            if self.service.connected:
-                loguru_logger.info("ReachyWobblerProcessor: Connected to Reachy successfully")
+# Number of recent frame keys remembered for duplicate detection
+DEDUP_WINDOW = 256
+_SPEAKING_FRAMES = (BotStartedSpeakingFrame, BotStoppedSpeakingFrame, UserStartedSpeakingFrame)
+
+
+class RecentAudioFrames:
+    """Bounded, insertion-ordered windows of recently handled frames.
+
+    Every frame is keyed by its pipecat id, so a frame reported again (the
+    observer gets one report per hop) is handled once. Audio frames are
+    also keyed by (pts, size) when they carry a presentation timestamp, else
+    by a CRC32 of the PCM, to catch the same audio re-sent under a new id.
+    With `by_content=False` only the id is used, so repeated identical
+    chunks (e.g. silence) are all kept.
+    """
+
+    def __init__(self, maxlen: int = DEDUP_WINDOW, by_content: bool = True):
+        self.maxlen = maxlen
+        self.by_content = by_content
+        self._ids: OrderedDict[int, None] = OrderedDict()
+        self._contents: OrderedDict[Hashable, None] = OrderedDict()
+
+    def clear(self):
+        self._ids.clear()
+        self._contents.clear()
+
+    def forget_content(self):
+        """Forget audio content keys (new speech may repeat audio); ids are kept."""
+        self._contents.clear()
+
+    def seen(self, frame: Frame) -> bool:
+        """Return True if `frame` is a duplicate, otherwise remember it."""
+        if frame.id in self._ids:
+            return True
+        if self.by_content and isinstance(frame, AudioRawFrame):
+            pts = getattr(frame, "pts", None)
+            if pts is not None:
+                content_key = ("pts", pts, len(frame.audio))
             else:
-                loguru_logger.warning("ReachyWobblerProcessor: Failed to connect to Reachy")
-        else:
-            loguru_logger.info("ReachyWobblerProcessor: Reachy already connected")
-        
+                content_key = ("crc", zlib.crc32(frame.audio), len(frame.audio))
+            if content_key in self._contents:
+                return True
+            self._remember(self._contents, content_key)
+        self._remember(self._ids, frame.id)
+        return False
+
+    def _remember(self, keys: OrderedDict, key: Hashable):
+        keys[key] = None
+        if len(keys) > self.maxlen:
+            keys.popitem(last=False)
+
+
+class ReachyFrameHandler:
+    """Speaking-state tracking and audio hand-off shared by the processor and observer.
+
+    Robot side effects go through `dispatch`, which calls them inline by
+    default; the observer passes a non-blocking executor submit instead.
+    `dedup_by_content` is forwarded to `RecentAudioFrames`.
+    """
+
+    def __init__(
+        self,
+        service: ReachyService,
+        dispatch: Callable[..., Any] | None = None,
+        dedup_by_content: bool = True,
+    ):
+        self.service = service
+        self.dispatch = dispatch or (lambda fn, *args: fn(*args))
         # Track bot speaking state
         self.bot_is_speaking = False
-        # Track seen audio frames to avoid duplicates
-        self.seen_audio_hashes = set()
-        # Clear hash set periodically to prevent memory growth
-        self.frame_count = 0
-        self.hash_clear_interval = 1000
+        # Track recently fed audio frames to avoid duplicates
+        self.recent_frames = RecentAudioFrames(by_content=dedup_by_content)
         # Track audio chunks fed
         self.chunks_fed = 0
-    
+
     def reset_state(self):
-        """Reset processor state (called on disconnect)."""
+        """Reset handler state (called on disconnect)."""
         self.bot_is_speaking = False
-        self.seen_audio_hashes.clear()
-        self.frame_count = 0
+        self.recent_frames.clear()
+
+    def handle(self, frame: Frame, direction: FrameDirection):
+        # Speaking frames may be reported once per hop; act on the first report
+        if isinstance(frame, _SPEAKING_FRAMES) and self.recent_frames.seen(frame):
+            return
 
-    async def process_frame(self, frame: Frame, direction: FrameDirection):
-        await super().process_frame(frame, direction)
-        
         # Track bot speaking state
         if isinstance(frame, BotStartedSpeakingFrame):
             self.bot_is_speaking = True
-            self.seen_audio_hashes.clear()  # Clear hashes when new speech starts
+            self.recent_frames.forget_content()  # New speech may repeat old audio
             self.chunks_fed = 0
             loguru_logger.info("🗣️ Bot started speaking - wobbler armed")
             
@@ -56,40 +110,75 @@ class ReachyWobblerProcessor(FrameProcessor):
             self.bot_is_speaking = False
             loguru_logger.info(f"🤐 Bot stopped speaking - fed {self.chunks_fed} audio chunks")
             if self.service.connected:
-                self.service.set_listening_pose()
-            self.seen_audio_hashes.clear()
+                self.dispatch(self.service.set_listening_pose)
+            self.recent_frames.forget_content()
             
         elif isinstance(frame, UserStartedSpeakingFrame):
             self.bot_is_speaking = False
             if self.service.connected:
-                self.service.set_listening_pose()
-            self.seen_audio_hashes.clear()
+                self.dispatch(self.service.set_listening_pose)
+            self.recent_frames.forget_content()
         
         # Only feed audio if bot is actively speaking
         elif isinstance(frame, AudioRawFrame) and direction == FrameDirection.DOWNSTREAM:
             if self.bot_is_speaking and self.service.connected:
-                # Create hash of audio data to detect duplicates
-                audio_hash = hashlib.md5(frame.audio).hexdigest()
-                
-                if audio_hash not in self.seen_audio_hashes:
-                    # Mark as seen
-                    self.seen_audio_hashes.add(audio_hash)
-                    
-                    # Feed to wobbler
-                    b64_audio = base64.b64encode(frame.audio).decode('utf-8')
-                    self.service.feed_audio(b64_audio)
+                # Skip frames that already went through (same id or content)
+                if not self.recent_frames.seen(frame):
+                    # Feed raw PCM to wobbler (no base64 round trip)
+                    self.dispatch(self.service.feed_pcm, frame.audio, frame.sample_rate, frame.num_channels)
                     self.chunks_fed += 1
                     
                     # Log first few chunks
                     if self.chunks_fed <= 3:
                         loguru_logger.debug(f"🎵 Fed audio chunk #{self.chunks_fed} ({len(frame.audio)} bytes)")
-                    
-                    # Periodically clear hash set to prevent unbounded growth
-                    self.frame_count += 1
-                    if self.frame_count >= self.hash_clear_interval:
-                        # Keep only the most recent hashes
-                        if len(self.seen_audio_hashes) > 100:
-                            self.seen_audio_hashes = set(list(self.seen_audio_hashes)[-100:])
-                        self.frame_count = 0
 
+
+def connect_service(service: ReachyService, owner: str):
+    """Connect the shared Reachy service if needed, logging on behalf of `owner`."""
+    if not service.connected:
+        loguru_logger.info(f"{owner}: Connecting to Reachy...")
+        service.connect()
+        _log_connect_result(service, owner)
+    else:
+        loguru_logger.info(f"{owner}: Reachy already connected")
+
+
+async def connect_service_async(service: ReachyService, owner: str):
+    """Same as `connect_service`, without blocking the event loop."""
+    if not service.connected:
+        loguru_logger.info(f"{owner}: Connecting to Reachy in the background...")
+        await service.connect_async()
+        _log_connect_result(service, owner)
+    else:
+        loguru_logger.info(f"{owner}: Reachy already connected")
+
+
+def _log_connect_result(service: ReachyService, owner: str):
+    if service.connected:
+        loguru_logger.info(f"{owner}: Connected to Reachy successfully")
+    else:
+        loguru_logger.warning(f"{owner}: Failed to connect to Reachy")
+
+
+class ReachyWobblerProcessor(FrameProcessor):
+    """In-line integration: handles frames on the audio path before passing them on.
+
+    Prefer `ReachyWobblerObserver`, which keeps robot work off the audio path.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.service = ReachyService.get_instance()
+        self.handler = ReachyFrameHandler(self.service)
+
+    def reset_state(self):
+        """Reset processor state (called on disconnect)."""
+        self.handler.reset_state()
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, StartFrame):
+            # Connect in the background; frames flow (without robot motion) meanwhile
+            self.create_task(connect_service_async(self.service, "ReachyWobblerProcessor"))
+        self.handler.handle(frame, direction)
         await self.push_frame(frame, direction)
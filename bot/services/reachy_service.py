@@ -1,13 +1,24 @@
+import os
+import time
+import socket
+import asyncio
 import threading
 import logging
 from reachy_mini import ReachyMini
 from .moves import MovementManager
 from .wobbler import HeadWobbler
-from .dance_emotion_moves import GotoQueueMove
+from .dance_emotion_moves import GotoQueueMove, get_move_registry, warm_up_moves
+from .move_library import DANCE, EMOTION
 from reachy_mini.utils import create_head_pose
 
 logger = logging.getLogger(__name__)
 
+# Readiness probes that replace fixed start-up sleeps
+READY_POLL_INTERVAL_S = 0.1
+DISPLAY_READY_TIMEOUT_S = 5.0
+DAEMON_READY_TIMEOUT_S = 15.0
+DAEMON_PORT = int(os.getenv('REACHY_DAEMON_PORT', '8000'))
+
 class ReachyService:
     _instance = None
     _lock = threading.Lock()
@@ -18,6 +29,10 @@ class ReachyService:
         self.wobbler = None
         self.host = host
         self.connected = False
+        self._connect_lock = threading.RLock()
+        self._connect_task: asyncio.Future | None = None
+        self._sessions_lock = threading.Lock()
+        self._active_sessions = 0
 
     @classmethod
     def get_instance(cls):
@@ -27,70 +42,171 @@ class ReachyService:
         return cls._instance
 
     def connect(self):
+        """Connect to the daemon and start the motion threads (blocking).
+
+        Waits for the display and the daemon with short readiness polls
+        rather than fixed sleeps. Prefer `connect_async` from the event loop.
+        """
         # If already connected, return
         if self.connected:
             logger.debug("Reachy already connected")
             return
-            
-        # If previously disconnected, clean up any leftover state
-        if self.robot or self.motion_manager or self.wobbler:
-            logger.info("Cleaning up previous Reachy connection...")
-            self.disconnect()
-            
+
+        if not self._wait_ready(self._display_ready, DISPLAY_READY_TIMEOUT_S):
+            logger.warning(f"Display {os.getenv('DISPLAY')} not ready after {DISPLAY_READY_TIMEOUT_S:g}s, connecting anyway")
+        if not self._wait_ready(self._daemon_ready, DAEMON_READY_TIMEOUT_S):
+            self._log_daemon_unavailable(f"no daemon listening on {self.host}:{DAEMON_PORT}")
+            return
+        self._connect_now()
+
+    async def connect_async(self):
+        """Connect without blocking the event loop.
+
+        Readiness is polled with asyncio sleeps and the robot client is built
+        in the default executor, so a session can start straight away and
+        robot control attaches once the daemon is up. Concurrent callers share
+        one attempt; cancelling a caller does not cancel the attempt.
+        """
+        if self.connected:
+            logger.debug("Reachy already connected")
+            return
+        task = self._connect_task
+        if task is None or task.done():
+            task = self._connect_task = asyncio.ensure_future(self._connect_when_ready())
+        await asyncio.shield(task)
+
+    async def _connect_when_ready(self):
+        if not await self._wait_ready_async(self._display_ready, DISPLAY_READY_TIMEOUT_S):
+            logger.warning(f"Display {os.getenv('DISPLAY')} not ready after {DISPLAY_READY_TIMEOUT_S:g}s, connecting anyway")
+        if not await self._wait_ready_async(self._daemon_ready, DAEMON_READY_TIMEOUT_S):
+            self._log_daemon_unavailable(f"no daemon listening on {self.host}:{DAEMON_PORT}")
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self._connect_now)
+
+    @staticmethod
+    def _wait_ready(check, timeout):
+        deadline = time.monotonic() + timeout
+        while not check():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(READY_POLL_INTERVAL_S)
+        return True
+
+    @staticmethod
+    async def _wait_ready_async(check, timeout):
+        deadline = time.monotonic() + timeout
+        while not check():
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(READY_POLL_INTERVAL_S)
+        return True
+
+    @staticmethod
+    def _display_ready():
+        """True once the local X server accepts connections (or there is none to wait for)."""
+        display = os.getenv('DISPLAY', '')
+        host, _, number = display.partition(':')
+        if not display or host not in ('', 'unix'):
+            return True
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         try:
-            import os
-            import time
-            
-            # Verify DISPLAY is set
-            display = os.getenv('DISPLAY')
-            logger.info(f"DISPLAY environment variable: {display}")
-            
-            # Give Xvfb extra time to stabilize
-            logger.info("Waiting for display to be ready...")
-            time.sleep(3)
-            
-            # 🔒 CUSTOM: Configurable media backend for sim vs physical
-            # - 'no_media' (default): For sim or when daemon handles camera
-            # - 'default' or None: For physical robot with direct camera access
-            media_backend = os.getenv('REACHY_MEDIA_BACKEND', 'no_media')
-            logger.info(f"Starting Reachy Mini with media_backend='{media_backend}'...")
-            
-            self.robot = ReachyMini(
-                use_sim=True,
-                spawn_daemon=False,
-                localhost_only=False,
-                media_backend=media_backend if media_backend != 'default' else None,
-                timeout=15.0,
-                log_level='DEBUG'
-            )
-            logger.info("Successfully connected to Reachy Mini daemon")
-            
-            # 1. Initialize Motor Cortex (Background Thread)
-            self.motion_manager = MovementManager(self.robot)
-            self.motion_manager.start() 
-            
-            # 2. Initialize Auditory Cortex (Links Audio -> Motion)
-            self.wobbler = HeadWobbler(self.motion_manager.set_speech_offsets)
-            self.wobbler.start()
-            
-            self.connected = True
-            logger.info("Reachy Service Started: Breathing & Sway active.")
-        except Exception as e:
-            import traceback
-            logger.warning(f"Reachy Mini daemon not available: {e}")
-            logger.warning(f"Full traceback: {traceback.format_exc()}")
-            logger.warning("Pipeline will continue without Reachy robot control.")
-            logger.warning("To enable Reachy: start daemon with 'mjpython -m reachy_mini.daemon.app.main --sim --no-localhost-only'")
-            
-            # Clean up partial robot object to avoid destructor errors
-            self.robot = None
-            # Don't raise - allow pipeline to run without Reachy
+            sock.settimeout(READY_POLL_INTERVAL_S)
+            sock.connect(f"/tmp/.X11-unix/X{number.split('.')[0]}")
+            return True
+        except OSError:
+            return False
+        finally:
+            sock.close()
+
+    def _daemon_ready(self):
+        """True once the daemon accepts TCP connections."""
+        try:
+            with socket.create_connection((self.host, DAEMON_PORT), timeout=READY_POLL_INTERVAL_S):
+                return True
+        except OSError:
+            return False
+
+    def _log_daemon_unavailable(self, reason):
+        logger.warning(f"Reachy Mini daemon not available: {reason}")
+        logger.warning("Pipeline will continue without Reachy robot control.")
+        logger.warning("To enable Reachy: start daemon with 'mjpython -m reachy_mini.daemon.app.main --sim --no-localhost-only'")
+
+    def _connect_now(self):
+        """Build the robot client and start the motion threads; the daemon must be up."""
+        with self._connect_lock:
+            # A concurrent connect may have finished while we waited
+            if self.connected:
+                return
+
+            # If previously disconnected, clean up any leftover state
+            if self.robot or self.motion_manager or self.wobbler:
+                logger.info("Cleaning up previous Reachy connection...")
+                self.disconnect()
+
+            try:
+                # 🔒 CUSTOM: Configurable media backend for sim vs physical
+                # - 'no_media' (default): For sim or when daemon handles camera
+                # - 'default' or None: For physical robot with direct camera access
+                media_backend = os.getenv('REACHY_MEDIA_BACKEND', 'no_media')
+                logger.info(f"Starting Reachy Mini with media_backend='{media_backend}'...")
+
+                self.robot = ReachyMini(
+                    use_sim=True,
+                    spawn_daemon=False,
+                    localhost_only=False,
+                    media_backend=media_backend if media_backend != 'default' else None,
+                    timeout=15.0,
+                    log_level='DEBUG'
+                )
+                logger.info("Successfully connected to Reachy Mini daemon")
 
-    def feed_audio(self, audio_chunk_base64):
-        """Feeds audio from TTS to the wobble engine."""
+                # 1. Initialize Motor Cortex (Background Thread)
+                self.motion_manager = MovementManager(self.robot)
+                # Skip set_target while the pose is static (lighter on a shared sim host)
+                self.motion_manager.command_deadband = os.getenv('REACHY_COMMAND_DEADBAND', '0') == '1'
+                # Pre-connected at server start: idle at the trickle rate until a session attaches
+                with self._sessions_lock:
+                    self.motion_manager.set_session_active(self._active_sessions > 0)
+                self.motion_manager.start()
+
+                # 2. Initialize Auditory Cortex (Links Audio -> Motion)
+                self.wobbler = HeadWobbler(
+                    self.motion_manager.queue_speech_offsets,
+                    self.motion_manager.clear_speech_offsets,
+                )
+                self.wobbler.start()
+
+                # 3. Preload REACHY_WARMUP_MOVES dances/emotions off the connect path
+                threading.Thread(target=warm_up_moves, name="reachy-move-warmup", daemon=True).start()
+
+                self.connected = True
+                logger.info("Reachy Service Started: Breathing & Sway active.")
+            except Exception as e:
+                import traceback
+                self._log_daemon_unavailable(e)
+                logger.warning(f"Full traceback: {traceback.format_exc()}")
+
+                # Clean up partial robot object to avoid destructor errors
+                self.robot = None
+                # Don't raise - allow pipeline to run without Reachy
+
+    def feed_audio(self, audio_chunk_base64, sample_rate=None, num_channels=1):
+        """Feeds audio from TTS to the wobble engine.
+
+        `sample_rate` and `num_channels` describe the int16 PCM (as carried by
+        pipecat's AudioRawFrame); the wobbler resamples it to its analysis rate.
+        """
         if self.wobbler:
             logger.info("Feeding audio to Reachy")
-            self.wobbler.feed(audio_chunk_base64)
+            self.wobbler.feed(audio_chunk_base64, sample_rate, num_channels)
+
+    def feed_pcm(self, buffer, sample_rate=None, num_channels=1):
+        """Feeds raw int16 PCM (bytes or memoryview) from TTS to the wobble engine.
+
+        Same as `feed_audio` without the base64 round trip.
+        """
+        if self.wobbler:
+            self.wobbler.feed_pcm(buffer, sample_rate, num_channels)
     
     def set_listening_pose(self):
         """Sets robot back to natural breathing/idle state (not frozen).
@@ -105,6 +221,29 @@ class ReachyService:
             self.motion_manager.set_listening(False)
             logger.info("Reachy set to natural breathing state (antennas will sway)")
 
+    def set_session_active(self, active: bool):
+        """Tells the motion loop whether a client session is running (idle rate tier)."""
+        if self.motion_manager:
+            self.motion_manager.set_session_active(active)
+
+    def attach_session(self, name: str = "session") -> "ReachySession":
+        """Attach a client session to the shared robot connection.
+
+        Cheap: the robot client and the motion threads stay up across
+        sessions; only per-session state is reset. Works before the
+        connection is ready, in which case the reset is a no-op.
+        """
+        session = ReachySession(self, name)
+        session.attach()
+        return session
+
+    def _reset_session_state(self):
+        """Drop speech sway and queued moves left over from a session."""
+        if self.wobbler:
+            self.wobbler.reset()
+        if self.motion_manager:
+            self.motion_manager.clear_move_queue()
+
     def look_at(self, direction: str):
         """Maps semantic direction to robot pose."""
         if not self.connected or not self.motion_manager or not self.robot:
@@ -141,6 +280,29 @@ class ReachyService:
         except Exception as e:
             logger.error(f"Look at failed: {e}")
 
+    def play_dance(self, name: str):
+        """Queues a dance from the move registry."""
+        self._play_registry_move(DANCE, name)
+
+    def play_emotion(self, name: str):
+        """Queues an emotion from the move registry."""
+        self._play_registry_move(EMOTION, name)
+
+    def _play_registry_move(self, kind: str, name: str):
+        # The registry serves the compiled library's trajectories when it has
+        # them and builds (and samples) anything else once per process
+        if not self.connected or not self.motion_manager:
+            logger.debug(f"Reachy not connected - ignoring {kind} '{name}'")
+            return
+
+        try:
+            move = get_move_registry().get(kind, name)
+            self.motion_manager.queue_move(move)
+            self.motion_manager.set_moving_state(move.duration)
+            logger.info(f"Reachy playing {kind} '{name}'")
+        except Exception as e:
+            logger.error(f"Playing {kind} '{name}' failed: {e}")
+
     def disconnect(self):
         """Disconnect and cleanup Reachy resources."""
         if not self.connected:
@@ -174,3 +336,44 @@ class ReachyService:
     def stop(self):
         """Alias for disconnect for backwards compatibility."""
         self.disconnect()
+
+
+class ReachySession:
+    """Lightweight per-session handle on the shared `ReachyService`.
+
+    Attaching and detaching reset the wobbler generation and the move queue
+    and switch the idle rate tier; the connection and threads are untouched.
+    """
+
+    def __init__(self, service: ReachyService, name: str = "session"):
+        self.service = service
+        self.name = name
+        self.attached = False
+
+    def attach(self):
+        """Start the session with a clean motion state."""
+        if self.attached:
+            return
+        self.attached = True
+        service = self.service
+        with service._sessions_lock:
+            service._active_sessions += 1
+        service._reset_session_state()
+        service.set_session_active(True)
+        logger.info(f"Reachy {self.name} attached")
+
+    def detach(self):
+        """End the session: clear its motion and return to idle breathing."""
+        if not self.attached:
+            return
+        self.attached = False
+        service = self.service
+        with service._sessions_lock:
+            service._active_sessions -= 1
+            remaining = service._active_sessions
+        service._reset_session_state()
+        service.set_listening_pose()
+        if remaining == 0:
+            # Idle loop drops to a trickle until the next client
+            service.set_session_active(False)
+        logger.info(f"Reachy {self.name} detached")
@@ -17,9 +17,8 @@ Tuning multipliers:
 """
 from __future__ import annotations
 import math
-from typing import Any, Dict, List
-from itertools import islice
-from collections import deque
+from typing import Any, Dict, List, Tuple
+from functools import lru_cache
 
 import numpy as np
 from numpy.typing import NDArray
@@ -59,21 +58,37 @@ LOUDNESS_GAMMA = 0.9
 SWAY_ATTACK_MS = 50
 SWAY_RELEASE_MS = 250
 
+# Streaming resampler: windowed-sinc half-width (zero crossings of the lower
+# rate), cutoff as a fraction of the lower Nyquist, and Kaiser window beta
+RESAMPLE_ZERO_CROSSINGS = 8
+RESAMPLE_ROLLOFF = 0.9
+RESAMPLE_KAISER_BETA = 8.6
+
 # Derived
 FRAME = int(SR * FRAME_MS / 1000)
 HOP = int(SR * HOP_MS / 1000)
+WINDOW = 10 * SR  # sliding window kept for VAD/env
 ATTACK_FR = max(1, int(VAD_ATTACK_MS / HOP_MS))
 RELEASE_FR = max(1, int(VAD_RELEASE_MS / HOP_MS))
 SWAY_ATTACK_FR = max(1, int(SWAY_ATTACK_MS / HOP_MS))
 SWAY_RELEASE_FR = max(1, int(SWAY_RELEASE_MS / HOP_MS))
 
+# Column order of `SwayRollRT.feed_array` rows (same order as the speech
+# offsets tuple consumed by `MovementManager.set_speech_offsets`)
+SWAY_COLUMNS = ("x", "y", "z", "roll", "pitch", "yaw")
+SWAY_X, SWAY_Y, SWAY_Z, SWAY_ROLL, SWAY_PITCH, SWAY_YAW = range(len(SWAY_COLUMNS))
+
+
+def _sum_squares(x: NDArray[np.float32]) -> Any:
+    """Sum of squares along the last axis, accumulated in float64."""
+    return np.square(x, dtype=np.float64).sum(axis=-1)
 
-def _rms_dbfs(x: NDArray[np.float32]) -> float:
-    """Root-mean-square in dBFS for float32 mono array in [-1,1]."""
-    # numerically stable rms (avoid overflow)
-    x = x.astype(np.float32, copy=False)
-    rms = np.sqrt(np.mean(x * x, dtype=np.float32) + 1e-12, dtype=np.float32)
-    return float(20.0 * math.log10(float(rms) + 1e-12))
+
+def _energy_dbfs(sum_sq: float, n: int = FRAME) -> float:
+    """Root-mean-square in dBFS from the sum of squares of `n` samples in [-1,1]."""
+    # running sums can drift a hair below zero once the frame goes silent
+    rms = math.sqrt(max(sum_sq, 0.0) / n + 1e-12)
+    return 20.0 * math.log10(rms + 1e-12)
 
 
 def _loudness_gain(db: float, offset: float = SENS_DB_OFFSET) -> float:
@@ -114,17 +129,82 @@ def _to_float32_mono(x: NDArray[Any]) -> NDArray[np.float32]:
     return a.astype(np.float32) / (scale if scale != 0.0 else 1.0)
 
 
-def _resample_linear(x: NDArray[np.float32], sr_in: int, sr_out: int) -> NDArray[np.float32]:
-    """Lightweight linear resampler for short buffers."""
-    if sr_in == sr_out or x.size == 0:
-        return x
-    # guard tiny sizes
-    n_out = int(round(x.size * sr_out / sr_in))
-    if n_out <= 1:
-        return np.zeros(0, dtype=np.float32)
-    t_in = np.linspace(0.0, 1.0, num=x.size, dtype=np.float32, endpoint=True)
-    t_out = np.linspace(0.0, 1.0, num=n_out, dtype=np.float32, endpoint=True)
-    return np.interp(t_out, t_in, x).astype(np.float32, copy=False)
+@lru_cache(maxsize=16)
+def _polyphase_filters(sr_in: int, sr_out: int) -> Tuple[int, int, NDArray[np.float32]]:
+    """Return (up, down, taps) for sr_in -> sr_out; cached per rate pair.
+
+    `taps[p]` holds the (time-reversed) sub-filter of phase `p`, so one output
+    sample is `taps[p] @ x[i - K + 1 : i + 1]` with K = taps.shape[1].
+    """
+    g = math.gcd(sr_in, sr_out)
+    up, down = sr_out // g, sr_in // g
+    factor = max(up, down)
+
+    # low-pass at the upsampled rate, gain `up` to make up for zero stuffing
+    half = RESAMPLE_ZERO_CROSSINGS * factor
+    n = np.arange(-half, half + 1, dtype=np.float64)
+    cutoff = RESAMPLE_ROLLOFF / factor
+    h = up * cutoff * np.sinc(cutoff * n) * np.kaiser(n.size, RESAMPLE_KAISER_BETA)
+
+    k = -(-h.size // up)
+    padded = np.zeros(k * up, dtype=np.float64)
+    padded[: h.size] = h
+    taps = np.ascontiguousarray(padded.reshape(k, up).T[:, ::-1], dtype=np.float32)
+    taps.setflags(write=False)
+    return up, down, taps
+
+
+class StreamResampler:
+    """Streaming polyphase resampler for mono float32 audio.
+
+    Filter history and output phase carry over between chunks, so a stream
+    split into arbitrary chunks resamples exactly like the whole signal.
+    """
+
+    def __init__(self, sr_in: int, sr_out: int = SR):
+        """Initialize for a fixed rate pair."""
+        self.sr_in = int(sr_in)
+        self.sr_out = int(sr_out)
+        self._up, self._down, self._taps = _polyphase_filters(self.sr_in, self.sr_out)
+        n_taps = self._taps.shape[1]
+        self._hist = np.zeros(n_taps - 1, dtype=np.float32)
+        self._work = np.zeros(0, dtype=np.float32)
+        self._offset = 0  # next output position (upsampled units) from chunk start
+
+    def reset(self) -> None:
+        """Forget filter history and phase; keep the cached filters."""
+        self._hist.fill(0.0)
+        self._offset = 0
+
+    def process(self, x: NDArray[np.float32]) -> NDArray[np.float32]:
+        """Resample the next chunk of the stream."""
+        if self.sr_in == self.sr_out or x.size == 0:
+            return x
+
+        up, down, taps = self._up, self._down, self._taps
+        n_hist = self._hist.size
+        n = x.size
+        if self._work.size < n_hist + n:
+            self._work = np.empty(2 * (n_hist + n), dtype=np.float32)
+        ext = self._work[: n_hist + n]
+        ext[:n_hist] = self._hist
+        ext[n_hist:] = x
+
+        start = self._offset
+        end = n * up
+        count = -(-(end - start) // down) if end > start else 0
+        y = np.empty(count, dtype=np.float32)
+
+        # outputs r, r + up, r + 2*up, ... share a phase and step `down` inputs
+        windows = np.lib.stride_tricks.sliding_window_view(ext, n_hist + 1)
+        for r in range(min(up, count)):
+            i0, phase = divmod(start + r * down, up)
+            m = len(range(r, count, up))
+            np.matmul(windows[i0 : i0 + (m - 1) * down + 1 : down], taps[phase], out=y[r::up])
+
+        self._offset = start + count * down - end
+        self._hist[:] = ext[n:]
+        return y
 
 
 class SwayRollRT:
@@ -132,14 +212,25 @@ class SwayRollRT:
 
     Usage:
         rt = SwayRollRT()
-        rt.feed(pcm_int16_or_float, sr) -> List[dict]
+        rt.feed_array(pcm_int16_or_float, sr) -> (n_hops, 6) array
+        rt.feed(pcm_int16_or_float, sr) -> List[dict]  # compatibility API
+
+    By default every hop of a chunk is computed in one batched pass; pass
+    ``batched=False`` to run the per-hop reference engine, which produces
+    identical results.
     """
 
-    def __init__(self, rng_seed: int = 7):
+    def __init__(self, rng_seed: int = 7, batched: bool = True):
         """Initialize state."""
         self._seed = int(rng_seed)
-        self.samples: deque[float] = deque(maxlen=10 * SR)  # sliding window for VAD/env
+        self.batched = bool(batched)
+        # preallocated ring for the VAD/env window + running frame energy
+        self.samples: NDArray[np.float32] = np.zeros(WINDOW, dtype=np.float32)
+        self._write_pos = 0
+        self._filled = 0
+        self._frame_energy = 0.0
         self.carry: NDArray[np.float32] = np.zeros(0, dtype=np.float32)
+        self._resampler: StreamResampler | None = None
 
         self.vad_on = False
         self.vad_above = 0
@@ -158,10 +249,33 @@ class SwayRollRT:
         self.phase_z = float(rng.random() * 2 * math.pi)
         self.t = 0.0
 
+        # per-column oscillator tables in SWAY_COLUMNS order (mm for x/y/z)
+        self._osc_amp = np.array(
+            [
+                SWAY_A_X_MM,
+                SWAY_A_Y_MM,
+                SWAY_A_Z_MM,
+                math.radians(SWAY_A_ROLL_DEG),
+                math.radians(SWAY_A_PITCH_DEG),
+                math.radians(SWAY_A_YAW_DEG),
+            ],
+        )
+        self._osc_omega = 2 * math.pi * np.array(
+            [SWAY_F_X, SWAY_F_Y, SWAY_F_Z, SWAY_F_ROLL, SWAY_F_PITCH, SWAY_F_YAW],
+        )
+        self._osc_phase = np.array(
+            [self.phase_x, self.phase_y, self.phase_z, self.phase_roll, self.phase_pitch, self.phase_yaw],
+        )
+
     def reset(self) -> None:
         """Reset state (VAD/env/buffers/time) but keep initial phases/seed."""
-        self.samples.clear()
+        self.samples.fill(0.0)
+        self._write_pos = 0
+        self._filled = 0
+        self._frame_energy = 0.0
         self.carry = np.zeros(0, dtype=np.float32)
+        if self._resampler is not None:
+            self._resampler.reset()
         self.vad_on = False
         self.vad_above = 0
         self.vad_below = 0
@@ -173,78 +287,93 @@ class SwayRollRT:
     def feed(self, pcm: NDArray[Any], sr: int | None) -> List[Dict[str, float]]:
         """Stream in PCM chunk. Returns a list of sway dicts, one per hop (HOP_MS).
 
+        Compatibility wrapper around `feed_array`, with translations in mm and
+        rotations in both radians and degrees.
+
         Args:
             pcm: np.ndarray, shape (N,) or (C,N)/(N,C); int or float.
             sr:  sample rate of `pcm` (None -> assume SR).
 
         """
+        hops = self._feed_hops(pcm, sr)
+        if not hops.shape[0]:
+            return []
+        rad = hops[:, SWAY_ROLL:]
+        deg = np.degrees(rad)
+        return [
+            {
+                "pitch_rad": r[SWAY_PITCH],
+                "yaw_rad": r[SWAY_YAW],
+                "roll_rad": r[SWAY_ROLL],
+                "pitch_deg": d[SWAY_PITCH - SWAY_ROLL],
+                "yaw_deg": d[SWAY_YAW - SWAY_ROLL],
+                "roll_deg": d[0],
+                "x_mm": r[SWAY_X],
+                "y_mm": r[SWAY_Y],
+                "z_mm": r[SWAY_Z],
+            }
+            for r, d in zip(hops.tolist(), deg.tolist())
+        ]
+
+    def feed_array(self, pcm: NDArray[Any], sr: int | None) -> NDArray[np.float64]:
+        """Stream in PCM chunk. Returns one row per hop (HOP_MS).
+
+        Rows are offsets in `SWAY_COLUMNS` order: x, y, z in metres and roll,
+        pitch, yaw in radians, ready for `MovementManager.set_speech_offsets`.
+
+        Args:
+            pcm: np.ndarray, shape (N,) or (C,N)/(N,C); int or float.
+            sr:  sample rate of `pcm` (None -> assume SR).
+
+        """
+        hops = self._feed_hops(pcm, sr)
+        hops[:, : SWAY_Z + 1] /= 1000.0
+        return hops
+
+    def _feed_hops(self, pcm: NDArray[Any], sr: int | None) -> NDArray[np.float64]:
+        """Consume whole hops of `pcm`; rows in SWAY_COLUMNS order, x/y/z in mm."""
         sr_in = SR if sr is None else int(sr)
         x = _to_float32_mono(pcm)
         if x.size == 0:
-            return []
+            return np.zeros((0, len(SWAY_COLUMNS)))
         if sr_in != SR:
-            x = _resample_linear(x, sr_in, SR)
+            if self._resampler is None or self._resampler.sr_in != sr_in:
+                self._resampler = StreamResampler(sr_in, SR)
+            x = self._resampler.process(x)
             if x.size == 0:
-                return []
+                return np.zeros((0, len(SWAY_COLUMNS)))
 
-        # append to carry and consume fixed HOP chunks
+        # append to carry and consume whole HOP chunks in one go
         if self.carry.size:
             self.carry = np.concatenate([self.carry, x])
         else:
             self.carry = x
 
-        out: List[Dict[str, float]] = []
-
-        while self.carry.size >= HOP:
-            hop = self.carry[:HOP]
-            remaining: NDArray[np.float32] = self.carry[HOP:]
-            self.carry = remaining
-
-            # keep sliding window for VAD/env computation
-            # (deque accepts any iterable; list() for small HOP is fine)
-            self.samples.extend(hop.tolist())
-            if len(self.samples) < FRAME:
+        n_hops = self.carry.size // HOP
+        if n_hops == 0:
+            return np.zeros((0, len(SWAY_COLUMNS)))
+        hops = self.carry[: n_hops * HOP]
+        self.carry = self.carry[n_hops * HOP :]
+
+        if self.batched:
+            return self._feed_hops_batched(hops)
+        return self._feed_hops_sequential(hops)
+
+    def _feed_hops_sequential(self, hops: NDArray[np.float32]) -> NDArray[np.float64]:
+        """Reference engine: process one hop at a time."""
+        out: List[Tuple[float, ...]] = []
+
+        for hop in hops.reshape(-1, HOP):
+            # the first HOP samples of the current frame leave it with this hop
+            evicted = self._ring_tail(FRAME)[:HOP]
+            self._ring_write(hop)
+            self._frame_energy += float(_sum_squares(hop)) - float(_sum_squares(evicted))
+            if self._filled < FRAME:
                 self.t += HOP_MS / 1000.0
                 continue
 
-            frame = np.fromiter(
-                islice(self.samples, len(self.samples) - FRAME, len(self.samples)),
-                dtype=np.float32,
-                count=FRAME,
-            )
-            db = _rms_dbfs(frame)
-
-            # VAD with hysteresis + attack/release
-            if db >= VAD_DB_ON:
-                self.vad_above += 1
-                self.vad_below = 0
-                if not self.vad_on and self.vad_above >= ATTACK_FR:
-                    self.vad_on = True
-            elif db <= VAD_DB_OFF:
-                self.vad_below += 1
-                self.vad_above = 0
-                if self.vad_on and self.vad_below >= RELEASE_FR:
-                    self.vad_on = False
-
-            if self.vad_on:
-                self.sway_up = min(SWAY_ATTACK_FR, self.sway_up + 1)
-                self.sway_down = 0
-            else:
-                self.sway_down = min(SWAY_RELEASE_FR, self.sway_down + 1)
-                self.sway_up = 0
-
-            up = self.sway_up / SWAY_ATTACK_FR
-            down = 1.0 - (self.sway_down / SWAY_RELEASE_FR)
-            target = up if self.vad_on else down
-            self.sway_env += ENV_FOLLOW_GAIN * (target - self.sway_env)
-            # clamp
-            if self.sway_env < 0.0:
-                self.sway_env = 0.0
-            elif self.sway_env > 1.0:
-                self.sway_env = 1.0
-
-            loud = _loudness_gain(db) * SWAY_MASTER
-            env = self.sway_env
+            db = _energy_dbfs(self._frame_energy)
+            loud, env = self._step_envelope(db)
             self.t += HOP_MS / 1000.0
 
             # oscillators
@@ -270,18 +399,101 @@ class SwayRollRT:
             y_mm = SWAY_A_Y_MM * loud * env * math.sin(2 * math.pi * SWAY_F_Y * self.t + self.phase_y)
             z_mm = SWAY_A_Z_MM * loud * env * math.sin(2 * math.pi * SWAY_F_Z * self.t + self.phase_z)
 
-            out.append(
-                {
-                    "pitch_rad": pitch,
-                    "yaw_rad": yaw,
-                    "roll_rad": roll,
-                    "pitch_deg": math.degrees(pitch),
-                    "yaw_deg": math.degrees(yaw),
-                    "roll_deg": math.degrees(roll),
-                    "x_mm": x_mm,
-                    "y_mm": y_mm,
-                    "z_mm": z_mm,
-                },
-            )
+            out.append((x_mm, y_mm, z_mm, roll, pitch, yaw))
+
+        return np.array(out, dtype=np.float64).reshape(-1, len(SWAY_COLUMNS))
 
-        return out
+    def _feed_hops_batched(self, hops: NDArray[np.float32]) -> NDArray[np.float64]:
+        """Batched engine: same outputs as `_feed_hops_sequential`, whole chunk at once.
+
+        Per-hop energies are computed as arrays, the running frame energy and
+        the VAD/envelope state machine run as a compact scalar pass, and the
+        oscillators are evaluated as one (n_hops, 6) array.
+        """
+        n_hops = hops.size // HOP
+
+        # frame energy is a running sum: + energy of each new hop, - energy of
+        # the HOP samples it pushes out of the frame (buf[i*HOP:(i+1)*HOP])
+        buf = np.concatenate([self._ring_tail(FRAME), hops])
+        hop_energy = _sum_squares(buf[FRAME:].reshape(n_hops, HOP)).tolist()
+        evicted_energy = _sum_squares(buf[: n_hops * HOP].reshape(n_hops, HOP)).tolist()
+        filled = self._filled
+        self._ring_write(hops)
+
+        skip = 0
+        while skip < n_hops and filled + (skip + 1) * HOP < FRAME:
+            self._frame_energy += hop_energy[skip] - evicted_energy[skip]
+            self.t += HOP_MS / 1000.0
+            skip += 1
+
+        n_out = n_hops - skip
+        env_arr = np.empty((n_out, 1), dtype=np.float64)
+        loud_arr = np.empty((n_out, 1), dtype=np.float64)
+        t_arr = np.empty((n_out, 1), dtype=np.float64)
+        for i in range(n_out):
+            self._frame_energy += hop_energy[skip + i] - evicted_energy[skip + i]
+            db = _energy_dbfs(self._frame_energy)
+            loud, env = self._step_envelope(db)
+            self.t += HOP_MS / 1000.0
+            loud_arr[i] = loud
+            env_arr[i] = env
+            t_arr[i] = self.t
+
+        # keep the (amplitude * loud) * env association of the scalar engine
+        return self._osc_amp * loud_arr * env_arr * np.sin(self._osc_omega * t_arr + self._osc_phase)
+
+    def _ring_write(self, x: NDArray[np.float32]) -> None:
+        """Append samples to the ring buffer in place."""
+        n = x.size
+        if n >= WINDOW:
+            self.samples[:] = x[-WINDOW:]
+            self._write_pos = 0
+        else:
+            end = self._write_pos + n
+            if end <= WINDOW:
+                self.samples[self._write_pos : end] = x
+            else:
+                split = WINDOW - self._write_pos
+                self.samples[self._write_pos :] = x[:split]
+                self.samples[: n - split] = x[split:]
+            self._write_pos = end % WINDOW
+        self._filled = min(WINDOW, self._filled + n)
+
+    def _ring_tail(self, n: int) -> NDArray[np.float32]:
+        """Copy of the last `n` samples (zeros where nothing was written yet)."""
+        start = self._write_pos - n
+        if start >= 0:
+            return self.samples[start : self._write_pos].copy()
+        return np.concatenate([self.samples[start:], self.samples[: self._write_pos]])
+
+    def _step_envelope(self, db: float) -> Tuple[float, float]:
+        """Advance VAD hysteresis + attack/release by one hop; return (loudness, envelope)."""
+        if db >= VAD_DB_ON:
+            self.vad_above += 1
+            self.vad_below = 0
+            if not self.vad_on and self.vad_above >= ATTACK_FR:
+                self.vad_on = True
+        elif db <= VAD_DB_OFF:
+            self.vad_below += 1
+            self.vad_above = 0
+            if self.vad_on and self.vad_below >= RELEASE_FR:
+                self.vad_on = False
+
+        if self.vad_on:
+            self.sway_up = min(SWAY_ATTACK_FR, self.sway_up + 1)
+            self.sway_down = 0
+        else:
+            self.sway_down = min(SWAY_RELEASE_FR, self.sway_down + 1)
+            self.sway_up = 0
+
+        up = self.sway_up / SWAY_ATTACK_FR
+        down = 1.0 - (self.sway_down / SWAY_RELEASE_FR)
+        target = up if self.vad_on else down
+        self.sway_env += ENV_FOLLOW_GAIN * (target - self.sway_env)
+        # clamp
+        if self.sway_env < 0.0:
+            self.sway_env = 0.0
+        elif self.sway_env > 1.0:
+            self.sway_env = 1.0
+
+        return _loudness_gain(db) * SWAY_MASTER, self.sway_env
@@ -1,88 +1,246 @@
 """Moves head given audio samples."""
 
+import os
 import time
-import queue
 import base64
 import logging
 import threading
-from typing import Tuple
+from typing import Any, Dict, Tuple
+from collections import deque
+from dataclasses import dataclass
 from collections.abc import Callable
 
 import numpy as np
 from numpy.typing import NDArray
 
-from .speech_tapper import HOP_MS, SwayRollRT
+from .speech_tapper import HOP, HOP_MS, SwayRollRT, StreamResampler, _to_float32_mono
 
 
+# Default input rate when the caller does not provide one (OpenAI realtime PCM)
 SAMPLE_RATE = 24000
-# Downsample to reduce load on simulator
+# Resample to the sway analysis rate to reduce load on simulator
 DOWNSAMPLE_RATE = 16000
-# Limit queue to prevent overwhelming simulator
-MAX_QUEUE_SIZE = 50
+# Upper bound on audio waiting for analysis; the oldest audio is dropped
+# beyond it so head motion never lags speech by more than this. A feed call
+# keeps at most this much of its own audio (its newest) and evicts only
+# audio queued by earlier calls, never its own head
+MAX_QUEUED_MS = float(os.getenv("REACHY_WOBBLER_MAX_QUEUED_MS", "400"))
+# Minimum seconds between backlog drop warnings
+DROP_LOG_INTERVAL_S = 1.0
+# Small TTS frames are coalesced into chunks of this many hops before
+# analysis, or flushed once the oldest pending sample is this old
+COALESCE_HOPS = 4
+COALESCE_DEADLINE_S = 0.03
 # seconds between audio and robot movement
 MOVEMENT_LATENCY_S = 0.08
 logger = logging.getLogger(__name__)
 
 
+@dataclass(eq=False)
+class _Generation:
+    """Generation token: swapped atomically by `reset`, compared by identity.
+
+    The schedule fields are only touched by the worker thread, except
+    `dropped_samples`, which the feeder bumps under the queue lock.
+    """
+
+    number: int
+    base_ts: float | None = None
+    hops_done: float = 0.0
+    dropped_samples: int = 0
+
+
 class HeadWobbler:
-    """Converts audio deltas (base64) into head movement offsets."""
+    """Converts audio (raw or base64 PCM) into head movement offsets.
+
+    Sway is not applied hop by hop: each analysed chunk is published as a
+    timestamped trajectory (rows of x, y, z, roll, pitch, yaw scheduled at
+    monotonic times) that the movement control loop samples at tick time.
+    """
 
     def __init__(
         self,
-        set_speech_offsets: Callable[
-            [Tuple[float, float, float, float, float, float]], None
-        ]
+        queue_speech_offsets: Callable[[NDArray[np.float64], NDArray[np.float64]], None],
+        clear_speech_offsets: Callable[[], None],
+        max_queued_ms: float = MAX_QUEUED_MS,
     ) -> None:
-        """Initialize the head wobbler."""
-        self._apply_offsets = set_speech_offsets
-        self._base_ts: float | None = None
-        self._hops_done: int = 0
-
-        self.audio_queue: (
-            "queue.Queue[Tuple[int, int, NDArray[np.int16]]]"
-        ) = queue.Queue(maxsize=MAX_QUEUE_SIZE)
+        """Initialize the head wobbler.
+
+        Args:
+            queue_speech_offsets: schedules offsets rows (n, 6) at times (n,),
+                e.g. `MovementManager.queue_speech_offsets`.
+            clear_speech_offsets: drops everything scheduled so far.
+            max_queued_ms: audio backlog above which the oldest audio is dropped.
+
+        """
+        self._publish_offsets = queue_speech_offsets
+        self._clear_offsets = clear_speech_offsets
+
+        # Consumer queue; the condition (and its lock) also orders
+        # publishing against reset()
+        # Chunks are (generation, rate, samples, arrival time of the first sample)
+        self.audio_queue: deque[Tuple[_Generation, int, NDArray[np.float32], float]] = deque()
+        self._queue_cond = threading.Condition()
+        self._max_queued_samples = max(1, int(DOWNSAMPLE_RATE * max_queued_ms / 1000))
+        self._queued_samples = 0
+        # Coalescing buffer for the current generation (also under the condition)
+        self._pending = np.empty(COALESCE_HOPS * HOP, dtype=np.float32)
+        self._pending_len = 0
+        self._pending_since = 0.0
+        # Stateful resampler, guarded by the feed lock: feeders resample and
+        # enqueue under it, so reset() never lands mid-chunk. Taken before
+        # the condition, never after, and never by the worker.
+        self._feed_lock = threading.Lock()
+        self._resampler = StreamResampler(SAMPLE_RATE, DOWNSAMPLE_RATE)
+
+        # Current generation; chunks are stamped with it. The sway engine is
+        # owned by the worker, which resets it when the generation changes.
+        self._generation = _Generation(0)
         self.sway = SwayRollRT()
-
-        # Synchronization primitives
-        self._state_lock = threading.Lock()
-        self._sway_lock = threading.Lock()
-        self._generation = 0
+        self._sway_generation = self._generation
 
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
 
-        # Track dropped frames for monitoring
+        # Backpressure counters (guarded by the queue condition)
         self._dropped_chunks = 0
+        self._dropped_samples = 0
+        self._peak_depth = 0
+        self._last_drop_log = float("-inf")
 
-    def feed(self, delta_b64: str) -> None:
-        """Thread-safe: push audio into the consumer queue."""
-        buf = np.frombuffer(
-            base64.b64decode(delta_b64), dtype=np.int16
-        ).reshape(1, -1)
+    def feed(
+        self,
+        delta_b64: str,
+        sample_rate: int | None = None,
+        num_channels: int = 1,
+    ) -> None:
+        """Thread-safe: push base64 audio into the consumer queue.
 
-        # Downsample audio to reduce processing load
-        if SAMPLE_RATE != DOWNSAMPLE_RATE:
-            # Simple decimation for downsampling (take every nth sample)
-            decimation_factor = SAMPLE_RATE // DOWNSAMPLE_RATE
-            buf = buf[:, ::decimation_factor]
+        Kept for the upstream conversation app; see `feed_pcm` for the args.
+        """
+        self.feed_pcm(base64.b64decode(delta_b64), sample_rate, num_channels)
 
-        with self._state_lock:
-            generation = self._generation
-
-        # Try to add to queue, but don't block if full (drop oldest/skip)
-        try:
-            self.audio_queue.put_nowait(
-                (generation, DOWNSAMPLE_RATE, buf)
+    def feed_pcm(
+        self,
+        buffer: bytes | bytearray | memoryview,
+        sample_rate: int | None = None,
+        num_channels: int = 1,
+    ) -> None:
+        """Thread-safe: push raw PCM into the consumer queue.
+
+        Args:
+            buffer: interleaved int16 PCM; wrapped without copying.
+            sample_rate: rate of the PCM (None -> SAMPLE_RATE).
+            num_channels: number of interleaved channels, averaged to mono.
+
+        """
+        pcm = np.frombuffer(buffer, dtype=np.int16, count=memoryview(buffer).nbytes // 2)
+        x = _to_float32_mono(pcm)
+        if num_channels > 1:
+            x = x[: x.size - x.size % num_channels].reshape(-1, num_channels).mean(axis=1)
+
+        sr_in = SAMPLE_RATE if sample_rate is None else int(sample_rate)
+        with self._feed_lock:
+            dropped = self._enqueue(x, sr_in)
+
+        # Rate-limited by time: drops come in bursts of any size
+        now = time.monotonic()
+        if dropped is not None and now - self._last_drop_log >= DROP_LOG_INTERVAL_S:
+            self._last_drop_log = now
+            logger.warning(
+                "Audio backlog over %.0f ms, dropped %.0f ms (%d chunks) total",
+                self._max_queued_samples * 1000 / DOWNSAMPLE_RATE,
+                dropped[0] * 1000 / DOWNSAMPLE_RATE,
+                dropped[1],
             )
-        except queue.Full:
-            # Queue is full - simulator is overwhelmed
-            # Drop this chunk to prevent freezing
-            self._dropped_chunks += 1
-            if self._dropped_chunks % 10 == 1:  # Log every 10th drop
-                logger.warning(
-                    "Audio queue full, dropped %d chunks total",
-                    self._dropped_chunks
-                )
+
+    def _enqueue(self, x: NDArray[np.float32], sr_in: int) -> Tuple[int, int] | None:
+        """Resample mono audio and add it to the queue; caller holds the feed lock.
+
+        Returns the total (dropped samples, dropped chunks) if this call
+        dropped anything, else None.
+        """
+        # Anti-aliased resampling to the analysis rate so that one hop of
+        # sway is HOP_MS of playback; filter state carries across chunks
+        if self._resampler.sr_in != sr_in:
+            self._resampler = StreamResampler(sr_in, DOWNSAMPLE_RATE)
+        y = self._resampler.process(x)
+
+        # Coalesce into the pending buffer and enqueue whole hop multiples;
+        # the worker flushes a partial buffer once COALESCE_DEADLINE_S passes
+        with self._queue_cond:
+            dropped_before = self._dropped_samples
+            if y.size > self._max_queued_samples:
+                # Keep the newest audio of an oversized call; the schedule skips the rest
+                trimmed = y.size - self._max_queued_samples
+                y = y[trimmed:]
+                self._generation.dropped_samples += trimmed
+                self._dropped_samples += trimmed
+            # Chunks queued by earlier calls; a burst never evicts its own head
+            evictable = len(self.audio_queue)
+            was_empty = self._pending_len == 0
+            if was_empty:
+                self._pending_since = time.monotonic()
+            while y.size:
+                n = min(y.size, self._pending.size - self._pending_len)
+                self._pending[self._pending_len : self._pending_len + n] = y[:n]
+                self._pending_len += n
+                y = y[n:]
+                if self._pending_len == self._pending.size:
+                    evictable -= self._flush_pending_locked(evictable)
+            if was_empty and self._pending_len:
+                # Arm the worker's deadline for this partial buffer
+                self._queue_cond.notify()
+            if self._dropped_samples == dropped_before:
+                return None
+            return self._dropped_samples, self._dropped_chunks
+
+    def _flush_pending_locked(self, evictable: int = 0) -> int:
+        """Enqueue the pending buffer and wake the worker; caller holds the condition.
+
+        Never blocks: if the backlog exceeds the budget, the oldest audio is
+        dropped so fresh speech wins. Only the first `evictable` queued chunks
+        (those the worker has had a chance to consume) may be dropped.
+        Returns the number of queued chunks dropped.
+        """
+        buf = self._pending[: self._pending_len].copy().reshape(1, -1)
+        arrived = self._pending_since
+        self._pending_len = 0
+        self._pending_since = time.monotonic()
+
+        generation = self._generation
+        dropped = 0
+        if buf.shape[1] > self._max_queued_samples:
+            dropped += buf.shape[1] - self._max_queued_samples
+            buf = buf[:, -self._max_queued_samples :]
+        self.audio_queue.append((generation, DOWNSAMPLE_RATE, buf, arrived))
+        self._queued_samples += buf.shape[1]
+        evicted = 0
+        while self._queued_samples > self._max_queued_samples and evicted < evictable:
+            _, _, old, _ = self.audio_queue.popleft()
+            self._queued_samples -= old.shape[1]
+            dropped += old.shape[1]
+            evicted += 1
+        self._dropped_chunks += evicted
+        self._peak_depth = max(self._peak_depth, len(self.audio_queue))
+        self._queue_cond.notify()
+        if dropped:
+            # Dropped audio still plays; the schedule must skip over it
+            generation.dropped_samples += dropped
+            self._dropped_samples += dropped
+        return evicted
+
+    def get_status(self) -> Dict[str, Any]:
+        """Return backpressure counters for observability."""
+        with self._queue_cond:
+            return {
+                "queued_ms": self._queued_samples * 1000 / DOWNSAMPLE_RATE,
+                "pending_ms": self._pending_len * 1000 / DOWNSAMPLE_RATE,
+                "dropped_ms": self._dropped_samples * 1000 / DOWNSAMPLE_RATE,
+                "dropped_chunks": self._dropped_chunks,
+                "queue_depth": len(self.audio_queue),
+                "peak_depth": self._peak_depth,
+            }
 
     def start(self) -> None:
         """Start the head wobbler loop in a thread."""
@@ -94,124 +252,100 @@ class HeadWobbler:
     def stop(self) -> None:
         """Stop the head wobbler loop."""
         self._stop_event.set()
+        with self._queue_cond:
+            self._queue_cond.notify_all()
         if self._thread is not None:
             self._thread.join()
         logger.debug("Head wobbler stopped")
 
     def working_loop(self) -> None:
-        """Convert audio deltas into head movement offsets."""
+        """Convert audio chunks into a timestamped head offsets trajectory."""
         hop_dt = HOP_MS / 1000.0
 
         logger.debug("Head wobbler thread started")
-        while not self._stop_event.is_set():
-            queue_ref = self.audio_queue
-            try:
-                chunk_generation, sr, chunk = queue_ref.get_nowait()
-            except queue.Empty:
-                # avoid while to never exit
-                time.sleep(MOVEMENT_LATENCY_S)
+        while True:
+            # Block until audio arrives (or stop); no polling while idle.
+            # A partially filled coalescing buffer is flushed at its deadline
+            with self._queue_cond:
+                while not self.audio_queue and not self._stop_event.is_set():
+                    if not self._pending_len:
+                        self._queue_cond.wait()
+                        continue
+                    remaining = self._pending_since + COALESCE_DEADLINE_S - time.monotonic()
+                    if remaining > 0:
+                        self._queue_cond.wait(remaining)
+                    else:
+                        self._flush_pending_locked()
+                if self._stop_event.is_set():
+                    break
+                chunk_generation, sr, chunk, arrived = self.audio_queue.popleft()
+                self._queued_samples -= chunk.shape[1]
+                skipped = chunk_generation.dropped_samples
+                chunk_generation.dropped_samples = 0
+
+            # One generation check per batch; stale chunks are discarded
+            generation = self._generation
+            if chunk_generation is not generation:
+                continue
+            if self._sway_generation is not generation:
+                self.sway.reset()
+                self._sway_generation = generation
+            if skipped:
+                generation.hops_done += skipped / (sr * hop_dt)
+
+            # rows are already (x, y, z, roll, pitch, yaw) in m / rad
+            offsets = self.sway.feed_array(np.asarray(chunk).squeeze(0), sr)
+            n_hops = offsets.shape[0]
+            if not n_hops:
                 continue
 
-            try:
-                with self._state_lock:
-                    current_generation = self._generation
-                if chunk_generation != current_generation:
-                    continue
-
-                if self._base_ts is None:
-                    with self._state_lock:
-                        if self._base_ts is None:
-                            self._base_ts = time.monotonic()
-
-                pcm = np.asarray(chunk).squeeze(0)
-                with self._sway_lock:
-                    results = self.sway.feed(pcm, sr)
-
-                i = 0
-                while i < len(results):
-                    with self._state_lock:
-                        if self._generation != current_generation:
-                            break
-                        base_ts = self._base_ts
-                        hops_done = self._hops_done
-
-                    if base_ts is None:
-                        base_ts = time.monotonic()
-                        with self._state_lock:
-                            if self._base_ts is None:
-                                self._base_ts = base_ts
-                                hops_done = self._hops_done
-
-                    target = base_ts + MOVEMENT_LATENCY_S + hops_done * hop_dt
-                    now = time.monotonic()
-
-                    if now - target >= hop_dt:
-                        lag_hops = int((now - target) / hop_dt)
-                        drop = min(lag_hops, len(results) - i - 1)
-                        if drop > 0:
-                            with self._state_lock:
-                                self._hops_done += drop
-                                hops_done = self._hops_done
-                            i += drop
-                            continue
-
-                    if target > now:
-                        time.sleep(target - now)
-                        with self._state_lock:
-                            if self._generation != current_generation:
-                                break
-
-                    r = results[i]
-                    offsets = (
-                        r["x_mm"] / 1000.0,
-                        r["y_mm"] / 1000.0,
-                        r["z_mm"] / 1000.0,
-                        r["roll_rad"],
-                        r["pitch_rad"],
-                        r["yaw_rad"],
-                    )
-
-                    with self._state_lock:
-                        if self._generation != current_generation:
-                            break
-
-                    self._apply_offsets(offsets)
-
-                    with self._state_lock:
-                        self._hops_done += 1
-                    i += 1
-            finally:
-                queue_ref.task_done()
+            # (Re)anchor the schedule on the first chunk, or when it has
+            # fallen behind playback (e.g. after a pause between replies).
+            # Anchored on the chunk's first sample arrival, not on now:
+            # coalescing may have held it for up to COALESCE_DEADLINE_S
+            if (
+                generation.base_ts is None
+                or arrived - (generation.base_ts + generation.hops_done * hop_dt) >= hop_dt
+            ):
+                generation.base_ts = arrived
+                generation.hops_done = 0
+            first = generation.base_ts + MOVEMENT_LATENCY_S + generation.hops_done * hop_dt
+            generation.hops_done += n_hops
+            times = first + hop_dt * np.arange(n_hops)
+
+            # reset() swaps the generation and clears under this lock, so
+            # stale rows can never be published after it
+            with self._queue_cond:
+                if self._generation is generation:
+                    self._publish_offsets(times, offsets)
         logger.debug("Head wobbler thread exited")
 
     def reset(self) -> None:
-        """Reset the internal state."""
-        with self._state_lock:
-            self._generation += 1
-            self._base_ts = None
-            self._hops_done = 0
-
-        # Drain any queued audio chunks from previous generations
-        drained_any = False
-        while True:
-            try:
-                _, _, _ = self.audio_queue.get_nowait()
-            except queue.Empty:
-                break
-            else:
-                drained_any = True
-                self.audio_queue.task_done()
-
-        with self._sway_lock:
-            self.sway.reset()
-
-        # Reset drop counter
-        if self._dropped_chunks > 0:
+        """Reset the internal state.
+
+        Starts a new generation: queued audio is drained, scheduled offsets are
+        cleared, the resampler forgets its filter history and the worker
+        resets the sway engine before its next chunk.
+        """
+        with self._feed_lock, self._queue_cond:
+            self._resampler.reset()
+            self._generation = _Generation(self._generation.number + 1)
+            self._clear_offsets()
+            # Drain any queued audio chunks from previous generations
+            drained_any = bool(self.audio_queue)
+            self.audio_queue.clear()
+            self._queued_samples = 0
+            self._pending_len = 0
+            dropped_chunks, dropped_samples = self._dropped_chunks, self._dropped_samples
+            self._dropped_chunks = self._dropped_samples = self._peak_depth = 0
+            self._queue_cond.notify_all()
+
+        if dropped_chunks > 0:
             logger.info(
-                "Reset wobbler - had dropped %d chunks",
-                self._dropped_chunks
+                "Reset wobbler - had dropped %d chunks (%.0f ms)",
+                dropped_chunks,
+                dropped_samples * 1000 / DOWNSAMPLE_RATE
             )
-            self._dropped_chunks = 0
 
         if drained_any:
             logger.debug("Head wobbler queue drained during reset")
@@ -0,0 +1,141 @@
+"""MovementManager control-tick behaviour, driven tick by tick without the worker thread.
+
+Run from the `bot/` directory: `python -m pytest tests`.
+"""
+
+import time
+import threading
+
+import numpy as np
+import pytest
+
+pytest.importorskip("reachy_mini")
+
+from services.moves import (  # noqa: E402
+    RATE_NO_SESSION,
+    ZERO_OFFSETS,
+    DenseTrajectoryMove,
+    MovementManager,
+    PresampledMove,
+    TickPoseBuffers,
+    write_head_pose,
+)
+
+
+class _EchoRobot:
+    """Minimal robot endpoint: reports the last target it was sent."""
+
+    def __init__(self):
+        self.head = np.eye(4)
+        self.antennas = [0.0, 0.0]
+
+    def set_target(self, head=None, antennas=None, body_yaw=None):
+        if head is not None:
+            self.head = np.array(head)
+        if antennas is not None:
+            self.antennas = [float(antennas[0]), float(antennas[1])]
+
+    def get_current_joint_positions(self):
+        return [0.0] * 7, list(self.antennas)
+
+    def get_current_head_pose(self):
+        return self.head.copy()
+
+
+def _run(manager, now, seconds):
+    """Tick at the rate the loop would pick; return (time, tier, antennas) per tick."""
+    ticks = []
+    end = now + seconds
+    while now < end:
+        manager._tick(now)
+        tier = manager._select_rate_tier(now)
+        ticks.append((now, tier, manager._last_commanded_pose[1]))
+        now += manager.rate_periods[tier]
+    return now, ticks
+
+
+def test_no_session_idle_holds_a_static_pose():
+    manager = MovementManager(_EchoRobot())
+    manager.set_session_active(False)
+    _, ticks = _run(manager, manager._now(), 20.0)
+
+    assert sum(tier == RATE_NO_SESSION for _, tier, _ in ticks) > 10
+    # Breathing sway sampled at the trickle rate would jump ~0.4 rad per tick
+    steps = [max(abs(a[0] - b[0]), abs(a[1] - b[1])) for (_, _, a), (_, _, b) in zip(ticks, ticks[1:])]
+    assert max(steps) < 0.01
+
+
+def _queue_speech(manager, now, hops=50):
+    """Schedule `hops` rows of 10 ms sway ending on a non-zero tilt."""
+    offsets = np.zeros((hops, 6))
+    offsets[:, 3] = 0.1
+    manager.queue_speech_offsets(now + 0.01 * np.arange(hops), offsets)
+
+
+def test_speech_sway_returns_to_the_primary_pose_when_drained():
+    manager = MovementManager(_EchoRobot())
+    now = manager._now()
+    _queue_speech(manager, now)
+    now, _ = _run(manager, now, 0.2)
+    assert manager.state.speech_offsets != ZERO_OFFSETS
+
+    _run(manager, now, 2.0)
+    assert manager.state.speech_offsets == ZERO_OFFSETS
+    assert manager._pose_buffers._secondary_is_identity
+    np.testing.assert_allclose(manager._last_commanded_pose[0], manager.state.last_primary_pose[0], atol=1e-9)
+
+
+def test_clear_speech_offsets_returns_the_sway_to_rest():
+    manager = MovementManager(_EchoRobot())
+    now = manager._now()
+    _queue_speech(manager, now, hops=500)
+    now, _ = _run(manager, now, 0.2)
+
+    manager.clear_speech_offsets()
+    _run(manager, now, 0.05)
+    assert manager.state.speech_offsets == ZERO_OFFSETS
+
+
+def test_zero_offset_fast_path_orthonormalizes_interpolated_primaries():
+    # Library-style float32 rows, 1 degree of yaw apart
+    heads = np.tile(np.eye(4, dtype=np.float32), (11, 1, 1))
+    for k, head in enumerate(heads):
+        write_head_pose(head, 0.0, 0.0, 0.0, 0.0, 0.2, np.deg2rad(k))
+    move = DenseTrajectoryMove(0.1, heads, np.zeros((11, 2), np.float32), np.zeros(11, np.float32))
+
+    buffers = TickPoseBuffers()
+    head, _, _ = move.evaluate(0.055)
+    np.copyto(buffers.primary, head)
+    buffers.set_secondary(0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    rotation = buffers.compose()[:3, :3]
+    np.testing.assert_allclose(rotation.T @ rotation, np.eye(3), atol=1e-9)
+
+
+class _CountingMove:
+    """One-second move that counts its evaluations."""
+
+    duration = 1.0
+
+    def __init__(self):
+        self.evaluations = 0
+
+    def evaluate(self, t):
+        self.evaluations += 1
+        time.sleep(0)
+        return np.eye(4), np.array([t, -t]), 0.0
+
+
+def test_shared_template_is_sampled_once():
+    source = _CountingMove()
+    template = PresampledMove(source, rate_hz=100.0)
+    instances = [template.instance() for _ in range(4)]
+
+    threads = [threading.Thread(target=move.sample) for move in [template, *instances]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert source.evaluations == 101
+    assert all(move.is_sampled for move in instances)
+    assert instances[0].evaluate(0.5)[1][0] == pytest.approx(0.5)
@@ -0,0 +1,44 @@
+"""HeadWobbler queueing, exercised without the worker thread."""
+
+import time
+
+import numpy as np
+
+from services.wobbler import DOWNSAMPLE_RATE, MOVEMENT_LATENCY_S, HeadWobbler
+
+
+def _pcm(seconds, sample_rate=24000):
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(int(seconds * sample_rate)) * 3000).astype(np.int16).tobytes()
+
+
+def test_backlog_stays_bounded_for_oversized_and_repeated_feeds():
+    wobbler = HeadWobbler(lambda times, offsets: None, lambda: None, max_queued_ms=400)
+    one_chunk_ms = wobbler._pending.size * 1000 / DOWNSAMPLE_RATE
+
+    wobbler.feed_pcm(_pcm(2.0), 24000)
+    status = wobbler.get_status()
+    assert status["queued_ms"] <= 400 + one_chunk_ms
+    assert status["dropped_ms"] >= 1500
+
+    for _ in range(5):
+        wobbler.feed_pcm(_pcm(0.2), 24000)
+    assert wobbler.get_status()["queued_ms"] <= 400 + one_chunk_ms
+
+
+def test_coalesced_audio_is_scheduled_from_its_arrival():
+    published = []
+    wobbler = HeadWobbler(lambda times, offsets: published.append(times), lambda: None)
+    wobbler.start()
+    try:
+        # 30 ms of audio: below one coalesced chunk, flushed at the deadline
+        arrived = time.monotonic()
+        wobbler.feed_pcm(_pcm(0.03), 24000)
+        deadline = time.monotonic() + 1.0
+        while not published and time.monotonic() < deadline:
+            time.sleep(0.005)
+    finally:
+        wobbler.stop()
+
+    assert published
+    assert published[0][0] - (arrived + MOVEMENT_LATENCY_S) < 0.01